@@ -5,6 +5,9 @@ Allows running Claude Code directly within FreeCAD's interface
 
 import os
 import sys
+import codecs
+import functools
+from collections import deque
 from PySide2 import QtCore, QtGui, QtWidgets
 
 import FreeCAD
@@ -13,6 +16,43 @@ import FreeCADGui
 # Global reference to the console panel
 _console_panel = None
 
+# Default number of lines kept in the output display (older lines are dropped)
+MAX_OUTPUT_BLOCKS = 2000
+
+# How long shell output is buffered before it is written to the display (ms)
+OUTPUT_FLUSH_INTERVAL = 30
+
+# Upper bound on how much unread shell output QProcess buffers internally
+SHELL_READ_BUFFER_SIZE = 1 << 20
+
+# Number of commands remembered for Up/Down history navigation
+MAX_HISTORY = 1000
+
+# File (in FreeCAD's user data dir) that keeps history between sessions
+HISTORY_FILE = "claude_console_history.txt"
+
+# Prompt shown for each shell type
+SHELL_PROMPTS = {
+    "PowerShell": "PS>",
+    "CMD": ">",
+    "Claude Code": "Claude>",
+}
+
+# Terminal colors (VS Code dark theme)
+TERMINAL_BACKGROUND = "#1e1e1e"
+TERMINAL_FOREGROUND = "#d4d4d4"
+TERMINAL_BORDER = "#333333"
+
+
+def apply_terminal_palette(widget):
+    """Apply the dark terminal colors to a text widget"""
+    # Palette rather than stylesheet: no CSS resolution on every relayout/repaint
+    pal = widget.palette()
+    pal.setColor(QtGui.QPalette.Base, QtGui.QColor(TERMINAL_BACKGROUND))
+    pal.setColor(QtGui.QPalette.Text, QtGui.QColor(TERMINAL_FOREGROUND))
+    pal.setColor(QtGui.QPalette.WindowText, QtGui.QColor(TERMINAL_BORDER))
+    widget.setPalette(pal)
+
 
 class TerminalWidget(QtWidgets.QWidget):
     """A terminal widget that runs PowerShell/cmd with Claude Code support"""
@@ -20,8 +60,21 @@ class TerminalWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.process = None
-        self.history = []
-        self.history_index = 0
+        self._restarting = False
+        self.history = deque(maxlen=MAX_HISTORY)
+        self._history_path = os.path.join(FreeCAD.getUserAppDataDir(), HISTORY_FILE)
+        self.load_history()
+        self.history_index = len(self.history)
+
+        # Shell output is collected here and written to the display in batches
+        self._pending = bytearray()
+        # Keeps partial UTF-8 sequences that straddle a flush boundary
+        self._decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setInterval(OUTPUT_FLUSH_INTERVAL)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -39,6 +92,15 @@ class TerminalWidget(QtWidgets.QWidget):
         toolbar.addWidget(QtWidgets.QLabel("Shell:"))
         toolbar.addWidget(self.shell_combo)
 
+        self.max_lines_spin = QtWidgets.QSpinBox()
+        self.max_lines_spin.setRange(100, 100000)
+        self.max_lines_spin.setSingleStep(500)
+        self.max_lines_spin.setValue(MAX_OUTPUT_BLOCKS)
+        self.max_lines_spin.setToolTip("Maximum number of lines kept in the output")
+        self.max_lines_spin.valueChanged.connect(self.set_max_lines)
+        toolbar.addWidget(QtWidgets.QLabel("Max lines:"))
+        toolbar.addWidget(self.max_lines_spin)
+
         toolbar.addStretch()
 
         clear_btn = QtWidgets.QPushButton("Clear")
@@ -54,16 +116,17 @@ class TerminalWidget(QtWidgets.QWidget):
         # Output display
         self.output = QtWidgets.QPlainTextEdit()
         self.output.setReadOnly(True)
+        self.output.setMaximumBlockCount(MAX_OUTPUT_BLOCKS)
         self.output.setFont(QtGui.QFont("Consolas", 10))
-        self.output.setStyleSheet("""
-            QPlainTextEdit {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                border: 1px solid #333;
-            }
-        """)
+        self.output.setFrameStyle(QtWidgets.QFrame.Box | QtWidgets.QFrame.Plain)
+        apply_terminal_palette(self.output)
         layout.addWidget(self.output, stretch=1)
 
+        # Output is written straight into the document through a cursor of our
+        # own (see append_output), bypassing the widget's editing API
+        self._doc = self.output.document()
+        self._append_cursor = QtGui.QTextCursor(self._doc)
+
         # Input line
         input_layout = QtWidgets.QHBoxLayout()
 
@@ -73,14 +136,8 @@ class TerminalWidget(QtWidgets.QWidget):
 
         self.input_line = QtWidgets.QLineEdit()
         self.input_line.setFont(QtGui.QFont("Consolas", 10))
-        self.input_line.setStyleSheet("""
-            QLineEdit {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                border: 1px solid #333;
-                padding: 4px;
-            }
-        """)
+        self.input_line.setTextMargins(4, 4, 4, 4)
+        apply_terminal_palette(self.input_line)
         self.input_line.returnPressed.connect(self.execute_command)
         self.input_line.installEventFilter(self)
         input_layout.addWidget(self.input_line, stretch=1)
@@ -108,14 +165,73 @@ class TerminalWidget(QtWidgets.QWidget):
                 return True
         return super().eventFilter(obj, event)
 
+    def load_history(self):
+        """Load command history saved by previous sessions"""
+        if not os.path.exists(self._history_path):
+            return
+        try:
+            with open(self._history_path, 'r', encoding='utf-8', errors='replace') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+
+        self.history.extend(line for line in lines if line)
+
+        # The file is only ever appended to, so trim it once here when it has
+        # grown well past what we keep in memory
+        if len(lines) > 2 * MAX_HISTORY:
+            try:
+                with open(self._history_path, 'w', encoding='utf-8') as f:
+                    f.writelines(cmd + "\n" for cmd in self.history)
+            except OSError:
+                pass
+
+    def save_history_entry(self, cmd):
+        """Append a single command to the history file"""
+        try:
+            with open(self._history_path, 'a', encoding='utf-8') as f:
+                f.write(cmd + "\n")
+        except OSError:
+            pass
+
     def start_shell(self):
-        """Start the shell process"""
+        """Start the shell process, stopping the current one first"""
+        if self.process and self.process.state() != QtCore.QProcess.NotRunning:
+            # Kill asynchronously and spawn the new shell once the old one has
+            # exited, rather than blocking the GUI in waitForFinished().
+            # A process killed while still starting reports errorOccurred
+            # and never finished, so either one ends the wait
+            if not self._restarting:
+                self._restarting = True
+                on_exit = functools.partial(self._on_old_shell_finished, self.process)
+                self.process.finished.connect(on_exit)
+                self.process.errorOccurred.connect(on_exit)
+                self.process.kill()
+            return
+
         if self.process:
-            self.process.kill()
-            self.process.waitForFinished()
+            self.process.deleteLater()
+        self._spawn_shell()
+
+    def _on_old_shell_finished(self, old_process, *args):
+        """Spawn the replacement shell once the previous one has exited"""
+        # Only once per restart (a crash emits both signals), and not for
+        # errors the old shell survived
+        if old_process is not self.process or old_process.state() != QtCore.QProcess.NotRunning:
+            return
+        self.process.deleteLater()
+        self.process = None
+        self._restarting = False
+        self._spawn_shell()
+
+    def _spawn_shell(self):
+        """Create and start a shell process for the selected shell type"""
+        # Don't carry a half-decoded character over into the new shell
+        self._decoder.reset()
 
         self.process = QtCore.QProcess(self)
         self.process.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        self.process.setReadBufferSize(SHELL_READ_BUFFER_SIZE)
         self.process.readyReadStandardOutput.connect(self.read_output)
         self.process.finished.connect(self.on_process_finished)
 
@@ -123,19 +239,21 @@ class TerminalWidget(QtWidgets.QWidget):
 
         if shell_type == "PowerShell":
             self.process.start("powershell.exe", ["-NoLogo", "-NoExit", "-Command", "-"])
-            self.prompt_label.setText("PS>")
         elif shell_type == "CMD":
             self.process.start("cmd.exe", ["/K"])
-            self.prompt_label.setText(">")
         elif shell_type == "Claude Code":
-            # Start PowerShell, then we'll run claude in it
+            # Start PowerShell and run claude in it as soon as the shell is up
+            # (connected before start(), which may emit started synchronously)
+            self.process.started.connect(self._launch_claude)
             self.process.start("powershell.exe", ["-NoLogo", "-NoExit", "-Command", "-"])
-            self.prompt_label.setText("Claude>")
-            # Auto-start claude after shell is ready
-            QtCore.QTimer.singleShot(500, lambda: self.send_command("claude"))
 
+        self.prompt_label.setText(SHELL_PROMPTS[shell_type])
         self.append_output(f"[Starting {shell_type}...]\n")
 
+    def _launch_claude(self):
+        """Run claude in the freshly started shell"""
+        self.send_command("claude")
+
     def restart_shell(self):
         """Restart the shell with current selection"""
         self.start_shell()
@@ -143,7 +261,7 @@ class TerminalWidget(QtWidgets.QWidget):
     def send_command(self, cmd):
         """Send a command to the shell process"""
         if self.process and self.process.state() == QtCore.QProcess.Running:
-            self.process.write((cmd + "\n").encode())
+            self.process.write(cmd.encode('utf-8', 'replace') + b"\n")
 
     def execute_command(self):
         """Execute the command from input line"""
@@ -151,13 +269,14 @@ class TerminalWidget(QtWidgets.QWidget):
         if not cmd:
             return
 
-        # Add to history
-        self.history.append(cmd)
+        # Add to history (skip immediate repeats)
+        if not self.history or self.history[-1] != cmd:
+            self.history.append(cmd)
+            self.save_history_entry(cmd)
         self.history_index = len(self.history)
 
         # Echo command
-        shell_type = self.shell_combo.currentText()
-        prompt = "PS>" if shell_type == "PowerShell" else ">" if shell_type == "CMD" else "Claude>"
+        prompt = SHELL_PROMPTS[self.shell_combo.currentText()]
         self.append_output(f"{prompt} {cmd}\n")
 
         # Send to process
@@ -167,19 +286,38 @@ class TerminalWidget(QtWidgets.QWidget):
     def read_output(self):
         """Read output from the shell process"""
         if self.process:
-            data = self.process.readAllStandardOutput().data()
-            try:
-                text = data.decode('utf-8', errors='replace')
-            except:
-                text = data.decode('cp1252', errors='replace')
-            self.append_output(text)
+            # Extend the pending buffer straight from the QByteArray; decoding
+            # happens once per flush, not once per chunk
+            self._pending += self.process.readAllStandardOutput().data()
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+
+    def _flush_pending(self):
+        """Write all buffered shell output to the display in one go"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        text = self._decoder.decode(self._pending)
+        self._pending.clear()
+        self.append_output(text)
 
     def append_output(self, text):
         """Append text to the output display"""
-        self.output.moveCursor(QtGui.QTextCursor.End)
-        self.output.insertPlainText(text)
-        self.output.moveCursor(QtGui.QTextCursor.End)
-        self.output.ensureCursorVisible()
+        # Only follow the output if the user hasn't scrolled up to read history
+        scrollbar = self.output.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        # Write straight into the document; the widget's own cursor (and any
+        # selection the user made) is left alone and no viewport signals fire
+        self._append_cursor.movePosition(QtGui.QTextCursor.End)
+        self._append_cursor.insertText(text)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def set_max_lines(self, count):
+        """Set how many lines the output display keeps"""
+        self.output.setMaximumBlockCount(count)
 
     def clear_output(self):
         """Clear the output display"""
@@ -187,6 +325,7 @@ class TerminalWidget(QtWidgets.QWidget):
 
     def on_process_finished(self, exit_code, exit_status):
         """Handle process termination"""
+        self._flush_pending()
         self.append_output(f"\n[Process exited with code {exit_code}]\n")
 
 
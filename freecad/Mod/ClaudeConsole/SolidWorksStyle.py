@@ -8,81 +8,85 @@ import FreeCADGui
 from PySide2 import QtWidgets, QtCore, QtGui
 
 
+# SolidWorks-style shortcuts (FreeCAD command name -> key sequence)
+SHORTCUTS = {
+    # View controls
+    'Std_ViewFront': 'Ctrl+1',
+    'Std_ViewBack': 'Ctrl+2',
+    'Std_ViewRight': 'Ctrl+3',
+    'Std_ViewLeft': 'Ctrl+4',
+    'Std_ViewTop': 'Ctrl+5',
+    'Std_ViewBottom': 'Ctrl+6',
+    'Std_ViewIsometric': 'Ctrl+7',
+    'Std_ViewFitAll': 'F',
+    'Std_ViewHome': 'Home',
+
+    # Sketch commands (when in sketcher)
+    'Sketcher_CreateLine': 'L',
+    'Sketcher_CreateRectangle': 'R',
+    'Sketcher_CreateCircle': 'C',
+    'Sketcher_CreateArc': 'A',
+    'Sketcher_CreatePoint': 'P',
+    'Sketcher_ConstrainCoincident': 'Ctrl+Shift+C',
+    'Sketcher_ConstrainHorizontal': 'H',
+    'Sketcher_ConstrainVertical': 'V',
+    'Sketcher_ConstrainEqual': 'E',
+    'Sketcher_ConstrainSymmetric': 'Ctrl+Shift+S',
+    'Sketcher_ConstrainLock': 'Ctrl+L',
+    'Sketcher_ConstrainDistance': 'D',
+    'Sketcher_Trimming': 'T',
+    'Sketcher_External': 'X',
+    'Sketcher_CreateFillet': 'Shift+F',
+
+    # Part Design commands
+    'PartDesign_Pad': 'Ctrl+Shift+P',
+    'PartDesign_Pocket': 'Ctrl+Shift+K',
+    'PartDesign_Revolution': 'Ctrl+Shift+R',
+    'PartDesign_Fillet': 'Ctrl+Shift+F',
+    'PartDesign_Chamfer': 'Ctrl+Shift+H',
+    'PartDesign_NewSketch': 'S',
+    'PartDesign_Hole': 'Ctrl+Shift+O',
+    'PartDesign_LinearPattern': 'Ctrl+Shift+L',
+    'PartDesign_PolarPattern': 'Ctrl+Shift+A',
+    'PartDesign_Mirrored': 'Ctrl+M',
+
+    # General
+    'Std_Undo': 'Ctrl+Z',
+    'Std_Redo': 'Ctrl+Y',
+    'Std_Cut': 'Ctrl+X',
+    'Std_Copy': 'Ctrl+C',
+    'Std_Paste': 'Ctrl+V',
+    'Std_Delete': 'Delete',
+    'Std_SelectAll': 'Ctrl+A',
+    'Std_New': 'Ctrl+N',
+    'Std_Open': 'Ctrl+O',
+    'Std_Save': 'Ctrl+S',
+    'Std_SaveAs': 'Ctrl+Shift+S',
+    'Std_Print': 'Ctrl+P',
+
+    # Measurement
+    'Part_Measure_Linear': 'Ctrl+Shift+M',
+
+    # Selection
+    'Std_BoxSelection': 'B',
+}
+
+
 def apply_solidworks_shortcuts():
     """Apply SolidWorks-style keyboard shortcuts"""
 
     # Get the main window
     mw = FreeCADGui.getMainWindow()
 
-    # Define SolidWorks-style shortcuts
-    shortcuts = {
-        # View controls
-        'Std_ViewFront': 'Ctrl+1',
-        'Std_ViewBack': 'Ctrl+2',
-        'Std_ViewRight': 'Ctrl+3',
-        'Std_ViewLeft': 'Ctrl+4',
-        'Std_ViewTop': 'Ctrl+5',
-        'Std_ViewBottom': 'Ctrl+6',
-        'Std_ViewIsometric': 'Ctrl+7',
-        'Std_ViewFitAll': 'F',
-        'Std_ViewHome': 'Home',
-
-        # Sketch commands (when in sketcher)
-        'Sketcher_CreateLine': 'L',
-        'Sketcher_CreateRectangle': 'R',
-        'Sketcher_CreateCircle': 'C',
-        'Sketcher_CreateArc': 'A',
-        'Sketcher_CreatePoint': 'P',
-        'Sketcher_ConstrainCoincident': 'Ctrl+Shift+C',
-        'Sketcher_ConstrainHorizontal': 'H',
-        'Sketcher_ConstrainVertical': 'V',
-        'Sketcher_ConstrainEqual': 'E',
-        'Sketcher_ConstrainSymmetric': 'Ctrl+Shift+S',
-        'Sketcher_ConstrainLock': 'Ctrl+L',
-        'Sketcher_ConstrainDistance': 'D',
-        'Sketcher_Trimming': 'T',
-        'Sketcher_External': 'X',
-        'Sketcher_CreateFillet': 'Shift+F',
-
-        # Part Design commands
-        'PartDesign_Pad': 'Ctrl+Shift+P',
-        'PartDesign_Pocket': 'Ctrl+Shift+K',
-        'PartDesign_Revolution': 'Ctrl+Shift+R',
-        'PartDesign_Fillet': 'Ctrl+Shift+F',
-        'PartDesign_Chamfer': 'Ctrl+Shift+H',
-        'PartDesign_NewSketch': 'S',
-        'PartDesign_Hole': 'Ctrl+Shift+O',
-        'PartDesign_LinearPattern': 'Ctrl+Shift+L',
-        'PartDesign_PolarPattern': 'Ctrl+Shift+A',
-        'PartDesign_Mirrored': 'Ctrl+M',
-
-        # General
-        'Std_Undo': 'Ctrl+Z',
-        'Std_Redo': 'Ctrl+Y',
-        'Std_Cut': 'Ctrl+X',
-        'Std_Copy': 'Ctrl+C',
-        'Std_Paste': 'Ctrl+V',
-        'Std_Delete': 'Delete',
-        'Std_SelectAll': 'Ctrl+A',
-        'Std_New': 'Ctrl+N',
-        'Std_Open': 'Ctrl+O',
-        'Std_Save': 'Ctrl+S',
-        'Std_SaveAs': 'Ctrl+Shift+S',
-        'Std_Print': 'Ctrl+P',
-
-        # Measurement
-        'Part_Measure_Linear': 'Ctrl+Shift+M',
-
-        # Selection
-        'Std_BoxSelection': 'B',
-    }
-
     # Apply shortcuts using FreeCAD's parameter system
     params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Shortcut")
 
-    for cmd, shortcut in shortcuts.items():
+    # Only write entries that actually change, so re-applying the style
+    # doesn't fire a parameter notification for every shortcut
+    for cmd, shortcut in SHORTCUTS.items():
         try:
-            params.SetString(cmd, shortcut)
+            if params.GetString(cmd, "") != shortcut:
+                params.SetString(cmd, shortcut)
         except:
             pass  # Command may not exist
 
@@ -93,7 +97,7 @@ def apply_solidworks_shortcuts():
     FreeCAD.Console.PrintMessage("  F = Fit All, Ctrl+1-7 = Standard Views\n")
     FreeCAD.Console.PrintMessage("  D = Dimension, T = Trim\n")
 
-    return shortcuts
+    return SHORTCUTS
 
 
 def apply_solidworks_mouse():
@@ -4,19 +4,34 @@ Convert various file formats to FreeCAD solids
 """
 
 import os
+import re
 import json
-import tempfile
-import urllib.request
-import urllib.parse
 import base64
+import functools
+import shutil
+import tempfile
+import threading
+import time
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import FreeCAD
-import FreeCADGui
-import Part
-import Mesh
-import MeshPart
 from PySide2 import QtWidgets, QtCore, QtGui
 
 
+def fast_temp_dir():
+    """
+    Get a directory for short-lived intermediate files
+
+    /dev/shm is RAM-backed on Linux, so a file written there and read
+    straight back (download -> Part.insert) never makes a round trip through
+    the disk. Elsewhere this is the normal temp directory, where a freshly
+    written file is still read back from the page cache.
+    """
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
 # ============================================================================
 # STL TO SOLID CONVERTER
 # ============================================================================
@@ -24,12 +39,6 @@ from PySide2 import QtWidgets, QtCore, QtGui
 class STLToSolidCommand:
     """Convert STL mesh files to solid bodies"""
 
-    def GetResources(self):
-        return {
-            'MenuText': 'STL to Solid',
-            'ToolTip': 'Convert an STL mesh file to a solid body'
-        }
-
     def Activated(self):
         # Open file dialog
         filename, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -44,9 +53,24 @@ class STLToSolidCommand:
 
         self.convert_mesh_to_solid(filename)
 
-    def convert_mesh_to_solid(self, filename, tolerance=0.1, sewing=True):
-        """Convert a mesh file to a solid"""
-        FreeCAD.Console.PrintMessage(f"Converting {filename} to solid...\n")
+    def convert_mesh_to_solid(self, filename, tolerance=0.1, sewing=True, recompute=True, shape_file=None,
+                              console=None):
+        """Convert a mesh file to a solid
+
+        Pass recompute=False when the caller adds more objects afterwards and
+        recomputes the document itself. If shape_file is given it is a BREP
+        already built from this mesh (see build_solids_in_parallel) and is
+        used instead of converting the mesh here. Progress is written to
+        console (FreeCAD.Console by default), which batch callers can replace
+        with a BufferedConsole.
+        """
+        import Part
+        import Mesh
+
+        if console is None:
+            console = FreeCAD.Console
+
+        console.PrintMessage(f"Converting {filename} to solid...\n")
 
         doc = FreeCAD.ActiveDocument
         if not doc:
@@ -54,38 +78,45 @@ class STLToSolidCommand:
             doc = FreeCAD.newDocument(name)
 
         try:
-            # Import mesh
+            # Import mesh, remembering what was already in the document so we
+            # pick up the object this import created rather than an older mesh
+            existing = {obj.Name for obj in doc.Objects}
             Mesh.insert(filename, doc.Name)
 
-            # Find the mesh object (last added)
             mesh_obj = None
             for obj in doc.Objects:
-                if obj.isDerivedFrom("Mesh::Feature"):
+                if obj.Name not in existing and obj.isDerivedFrom("Mesh::Feature"):
                     mesh_obj = obj
 
             if not mesh_obj:
-                FreeCAD.Console.PrintError("Failed to import mesh\n")
+                console.PrintError("Failed to import mesh\n")
                 return None
 
             mesh_name = mesh_obj.Name
-            FreeCAD.Console.PrintMessage(f"Imported mesh: {mesh_name}\n")
-
-            # Convert mesh to shape
-            shape = Part.Shape()
-            shape.makeShapeFromMesh(mesh_obj.Mesh.Topology, tolerance)
-
-            if sewing:
-                # Sew the shape to close gaps
-                shape = shape.copy()
-                shape.sewShape()
+            console.PrintMessage(f"Imported mesh: {mesh_name}\n")
 
-            # Try to make solid
-            try:
-                solid = Part.makeSolid(shape)
-                FreeCAD.Console.PrintMessage("Successfully created solid\n")
-            except:
-                FreeCAD.Console.PrintWarning("Could not create solid, using shell instead\n")
-                solid = shape
+            if shape_file:
+                # Solid was already built by a worker process
+                solid = Part.read(shape_file)
+            else:
+                # Convert mesh to shape (fetch the topology tuple once and release
+                # it before sewing, it can be very large for big meshes)
+                topo = mesh_obj.Mesh.Topology
+                shape = Part.Shape()
+                shape.makeShapeFromMesh(topo, tolerance)
+                del topo
+
+                if sewing:
+                    # Sew the shape to close gaps (in place, no copy needed)
+                    shape.sewShape()
+
+                # Try to make solid
+                try:
+                    solid = Part.makeSolid(shape)
+                    console.PrintMessage("Successfully created solid\n")
+                except:
+                    console.PrintWarning("Could not create solid, using shell instead\n")
+                    solid = shape
 
             # Create Part feature
             part_obj = doc.addObject("Part::Feature", mesh_name + "_Solid")
@@ -94,34 +125,84 @@ class STLToSolidCommand:
             # Optionally remove original mesh
             # doc.removeObject(mesh_name)
 
-            doc.recompute()
+            if recompute:
+                doc.recompute()
 
             # Report statistics
             if hasattr(solid, 'Volume'):
-                FreeCAD.Console.PrintMessage(f"Volume: {solid.Volume:.2f} mm³\n")
+                console.PrintMessage(f"Volume: {solid.Volume:.2f} mm³\n")
             if hasattr(solid, 'Area'):
-                FreeCAD.Console.PrintMessage(f"Surface Area: {solid.Area:.2f} mm²\n")
+                console.PrintMessage(f"Surface Area: {solid.Area:.2f} mm²\n")
 
-            FreeCAD.Console.PrintMessage("Conversion complete!\n")
+            console.PrintMessage("Conversion complete!\n")
             return part_obj
 
         except Exception as e:
-            FreeCAD.Console.PrintError(f"Conversion failed: {e}\n")
+            console.PrintError(f"Conversion failed: {e}\n")
             return None
 
     def IsActive(self):
         return True
 
 
+class BufferedConsole:
+    """
+    Collects FreeCAD console output and writes it out in batches
+
+    Every Print call appends to the Report view and repaints it, which on a
+    batch of hundreds of files costs more than the conversions. Output is
+    kept in order and consecutive pieces of the same kind are joined into
+    one call.
+    """
+
+    def __init__(self, flush_interval=0.25):
+        self.flush_interval = flush_interval
+        self._parts = []  # [kind, [text, ...]]
+        self._last_flush = time.monotonic()
+
+    def _add(self, kind, text):
+        if self._parts and self._parts[-1][0] == kind:
+            self._parts[-1][1].append(text)
+        else:
+            self._parts.append([kind, [text]])
+
+    def PrintMessage(self, text):
+        self._add("PrintMessage", text)
+
+    def PrintWarning(self, text):
+        self._add("PrintWarning", text)
+
+    def PrintError(self, text):
+        self._add("PrintError", text)
+
+    def flush(self):
+        """Write everything collected so far to FreeCAD.Console"""
+        for kind, texts in self._parts:
+            getattr(FreeCAD.Console, kind)("".join(texts))
+        self._parts = []
+        self._last_flush = time.monotonic()
+
+    def flush_if_due(self):
+        """Flush if flush_interval seconds have passed since the last flush"""
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+
+# Shared converter used by the dialogs and batch commands
+_stl_converter = None
+
+
+def get_stl_converter():
+    """Get the shared STLToSolidCommand used for mesh to solid conversion"""
+    global _stl_converter
+    if _stl_converter is None:
+        _stl_converter = STLToSolidCommand()
+    return _stl_converter
+
+
 class STLToSolidAdvancedCommand:
     """Advanced STL to solid with options dialog"""
 
-    def GetResources(self):
-        return {
-            'MenuText': 'STL to Solid (Advanced)...',
-            'ToolTip': 'Convert STL with advanced options for tolerance and repair'
-        }
-
     def Activated(self):
         dialog = STLConversionDialog()
         dialog.exec_()
@@ -207,18 +288,21 @@ class STLConversionDialog(QtWidgets.QDialog):
         sewing = self.sewing_check.isChecked()
 
         # Do conversion
-        converter = STLToSolidCommand()
-        result = converter.convert_mesh_to_solid(filename, tolerance, sewing)
-
-        if result and self.refine_check.isChecked():
-            # Refine the shape
-            try:
-                doc = FreeCAD.ActiveDocument
-                refined = doc.addObject("Part::Refine", result.Name + "_Refined")
-                refined.Source = result
-                doc.recompute()
-            except Exception as e:
-                FreeCAD.Console.PrintWarning(f"Refine failed: {e}\n")
+        converter = get_stl_converter()
+        result = converter.convert_mesh_to_solid(filename, tolerance, sewing, recompute=False)
+
+        if result:
+            doc = result.Document
+            if self.refine_check.isChecked():
+                # Refine the shape
+                try:
+                    refined = doc.addObject("Part::Refine", result.Name + "_Refined")
+                    refined.Source = result
+                except Exception as e:
+                    FreeCAD.Console.PrintWarning(f"Refine failed: {e}\n")
+
+            # Single recompute for the solid and its refinement
+            doc.recompute()
 
         self.accept()
 
@@ -227,15 +311,580 @@ class STLConversionDialog(QtWidgets.QDialog):
 # ONSHAPE IMPORTER
 # ============================================================================
 
+ONSHAPE_HOST = "https://cad.onshape.com"
+ONSHAPE_API_URL = ONSHAPE_HOST + "/api/v5"
+
+# Size of the pieces an export is streamed to disk in
+ONSHAPE_CHUNK_SIZE = 256 * 1024
+
+# Maximum number of exports downloaded at the same time
+ONSHAPE_MAX_PARALLEL = 8
+
+# Translation jobs are polled with exponential backoff from
+# ONSHAPE_POLL_INITIAL up to ONSHAPE_POLL_MAX seconds between checks
+ONSHAPE_POLL_INITIAL = 0.5
+ONSHAPE_POLL_MAX = 5.0
+
+# Large single exports are fetched as parallel byte ranges: the first request
+# asks for ONSHAPE_RANGE_SIZE bytes, anything beyond that is split into up to
+# ONSHAPE_RANGE_PARTS ranges of at least ONSHAPE_RANGE_MIN_PART bytes
+ONSHAPE_RANGE_SIZE = 32 * 1024 * 1024
+ONSHAPE_RANGE_PARTS = 4
+ONSHAPE_RANGE_MIN_PART = 4 * 1024 * 1024
+
+# Shared HTTP session so repeated Onshape requests reuse pooled keep-alive
+# connections instead of paying a TCP + TLS handshake each time
+_onshape_session = None
+
+
+def get_onshape_session():
+    """Get the shared requests session used for Onshape API calls"""
+    global _onshape_session
+    if _onshape_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        session = requests.Session()
+        session.mount(ONSHAPE_HOST, HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+        _onshape_session = session
+    return _onshape_session
+
+
+# Credentials live in the OS keyring (Windows Credential Manager, macOS
+# Keychain, Secret Service/KWallet) when the optional 'keyring' package is
+# installed; the plaintext JSON file is only a fallback and is migrated away
+ONSHAPE_KEYRING_SERVICE = "onshape"
+ONSHAPE_CREDENTIALS_FILE = os.path.join(os.path.expanduser("~"), ".onshape_credentials.json")
+
+# (access_key, secret_key) once loaded, so the dialog doesn't hit the
+# keyring/disk every time it opens
+_onshape_credentials = None
+
+# Serialises background credential saves
+_credentials_save_lock = threading.Lock()
+
+
+def _get_keyring():
+    """Get the keyring module, or None if it isn't installed"""
+    try:
+        import keyring
+        return keyring
+    except ImportError:
+        return None
+
+
+def _read_credentials_file():
+    """Read (access_key, secret_key) from the legacy JSON file"""
+    try:
+        with open(ONSHAPE_CREDENTIALS_FILE, 'r') as f:
+            creds = json.load(f)
+        return creds.get("access_key", ""), creds.get("secret_key", "")
+    except (OSError, ValueError):
+        return "", ""
+
+
+def _write_credentials_file(access_key, secret_key):
+    """Write credentials to the legacy JSON file"""
+    creds = {
+        "access_key": access_key,
+        "secret_key": secret_key
+    }
+    # Write a sibling temp file and swap it in, so an interrupted save can
+    # never leave a truncated credentials file behind
+    cred_dir = os.path.dirname(ONSHAPE_CREDENTIALS_FILE)
+    fd, temp_path = tempfile.mkstemp(dir=cred_dir, prefix=".onshape_credentials.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(creds, f)
+        os.replace(temp_path, ONSHAPE_CREDENTIALS_FILE)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def load_onshape_credentials():
+    """Get the saved (access_key, secret_key), empty strings if none"""
+    global _onshape_credentials
+    if _onshape_credentials is None:
+        creds = None
+        keyring = _get_keyring()
+        if keyring is not None:
+            try:
+                access_key = keyring.get_password(ONSHAPE_KEYRING_SERVICE, "access_key")
+                secret_key = keyring.get_password(ONSHAPE_KEYRING_SERVICE, "secret_key")
+                if access_key or secret_key:
+                    creds = (access_key or "", secret_key or "")
+            except Exception as e:
+                FreeCAD.Console.PrintWarning(f"Could not read Onshape credentials from keyring: {e}\n")
+
+        if creds is None:
+            creds = _read_credentials_file()
+            # Move credentials saved by older versions into the keyring
+            if any(creds) and keyring is not None:
+                save_onshape_credentials(*creds)
+        _onshape_credentials = creds
+    return _onshape_credentials
+
+
+def _store_credentials(access_key, secret_key):
+    """Write credentials to the keyring, or the JSON file without one"""
+    with _credentials_save_lock:
+        keyring = _get_keyring()
+        saved = False
+        if keyring is not None:
+            try:
+                keyring.set_password(ONSHAPE_KEYRING_SERVICE, "access_key", access_key)
+                keyring.set_password(ONSHAPE_KEYRING_SERVICE, "secret_key", secret_key)
+                saved = True
+            except Exception as e:
+                FreeCAD.Console.PrintWarning(f"Could not save Onshape credentials to keyring: {e}\n")
+
+        try:
+            if saved:
+                # Don't leave a plaintext copy behind once the keyring has it
+                if os.path.exists(ONSHAPE_CREDENTIALS_FILE):
+                    os.remove(ONSHAPE_CREDENTIALS_FILE)
+            else:
+                _write_credentials_file(access_key, secret_key)
+        except OSError as e:
+            FreeCAD.Console.PrintWarning(f"Could not save Onshape credentials: {e}\n")
+
+
+def save_onshape_credentials(access_key, secret_key):
+    """
+    Save credentials to the keyring, or the JSON file without one
+
+    The in-memory copy is updated immediately; the keyring/disk write runs
+    in a background thread so a slow keyring or network home directory
+    can't stall the dialog.
+    """
+    global _onshape_credentials
+    _onshape_credentials = (access_key, secret_key)
+    threading.Thread(target=_store_credentials, args=(access_key, secret_key), daemon=True).start()
+
+
+@functools.lru_cache(maxsize=4)
+def onshape_auth(access_key, secret_key):
+    """
+    Get a requests auth callable for an Onshape API key pair
+
+    The Basic Authorization header is encoded once per key pair and reused
+    for every request, including each file and byte range of a download.
+    """
+    header = "Basic " + base64.b64encode(f"{access_key}:{secret_key}".encode()).decode()
+
+    def apply(request):
+        request.headers["Authorization"] = header
+        return request
+    return apply
+
+
+# Document, workspace/version and element IDs from an Onshape URL:
+# https://cad.onshape.com/documents/{did}/w/{wid}/e/{eid}
+_ONSHAPE_URL_RE = re.compile(r"/documents/([^/?#]+)(?:/([wv])/([^/?#]+))?(?:/e/([^/?#]+))?")
+
+
+class DownloadCancelled(Exception):
+    """Raised when a download is stopped by the user"""
+
+
+def _copy_response(response, f, on_bytes, cancel_event):
+    """Write a streamed response to an open file chunk by chunk"""
+    for chunk in response.iter_content(ONSHAPE_CHUNK_SIZE):
+        if cancel_event.is_set():
+            raise DownloadCancelled()
+        f.write(chunk)
+        on_bytes(len(chunk))
+
+
+def _preallocate(f, size):
+    """
+    Reserve size bytes for an open file before it is written
+
+    posix_fallocate gets the filesystem to allocate the extents in one go,
+    so the writes that follow don't grow the file (and its metadata) chunk
+    by chunk. Windows has no equivalent without extra privileges; setting
+    the end of file there still reserves the space on NTFS.
+    """
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass  # Filesystem doesn't support it
+    f.truncate(size)
+
+
+def _spill_path(dest_path, size):
+    """
+    Get where to write a size-byte export that is meant for dest_path
+
+    dest_path is normally in RAM-backed /dev/shm (see fast_temp_dir), which
+    holds only part of RAM, and _preallocate reserves the whole size up
+    front. An export larger than the free space there goes to a private
+    file in the normal temp directory instead.
+    """
+    try:
+        st = os.statvfs(os.path.dirname(dest_path))
+    except (AttributeError, OSError):
+        return dest_path  # No statvfs on Windows, where there's no /dev/shm
+    if size <= st.f_bavail * st.f_frsize:
+        return dest_path
+    fd, path = tempfile.mkstemp(prefix="onshape_import_", suffix=os.path.splitext(dest_path)[1])
+    os.close(fd)
+    return path
+
+
+def _content_range_total(response):
+    """Total file size from a 206 response's Content-Range, or None"""
+    if response.status_code != 206:
+        return None
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _download_range(url, dest_path, auth, start, end, timeout, on_bytes, cancel_event):
+    """Fetch bytes start..end (inclusive) of url into dest_path at that offset"""
+    session = get_onshape_session()
+    # Ranges index the raw bytes, so ask for them uncompressed
+    headers = {
+        "Accept": "application/octet-stream",
+        "Accept-Encoding": "identity",
+        "Range": f"bytes={start}-{end}",
+    }
+    with session.get(url, auth=auth, headers=headers, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise IOError(f"Server ignored range request for bytes {start}-{end}")
+        with open(dest_path, 'r+b') as f:
+            f.seek(start)
+            _copy_response(response, f, on_bytes, cancel_event)
+
+
+def download_onshape_file(url, dest_path, auth, timeout=(10, 300), progress=None, cancel_event=None,
+                          ranged=True, compress=False):
+    """
+    Stream an Onshape export to disk
+
+    Bytes are written in ONSHAPE_CHUNK_SIZE pieces as they arrive, so memory
+    use stays constant no matter how large the export is.
+
+    The first request asks for the leading ONSHAPE_RANGE_SIZE bytes. If the
+    server honours it (206) and the file is larger, the rest is split into
+    ONSHAPE_RANGE_PARTS byte ranges fetched on parallel connections, each
+    written at its own offset. A server that ignores Range sends the whole
+    file (200) and it is streamed over the one connection as usual.
+
+    Text formats such as STEP shrink several times under gzip, so with
+    compress the file is requested gzip/deflate encoded over one connection
+    and decoded as it streams instead (byte ranges of a compressed body
+    can't be decoded independently).
+
+    Args:
+        url: Onshape API URL to download
+        dest_path: File to write the export to
+        auth: Auth from onshape_auth()
+        timeout: (connect, read) timeouts in seconds. The read timeout is
+            the longest wait for the next bytes, not for the whole file, so
+            a large export can take as long as it needs while a stalled
+            connection is still dropped.
+        progress: Optional callback(bytes_done, bytes_total), called after
+            each chunk. bytes_total is 0 when the size isn't known.
+        cancel_event: Optional threading.Event; when set the download stops
+            with DownloadCancelled.
+        ranged: Allow splitting the download into parallel byte ranges
+        compress: Request a gzip/deflate encoded transfer (disables ranged)
+
+    Returns:
+        Path the export was written to: dest_path, or a file in the normal
+        temp directory if it didn't fit where dest_path is (see _spill_path)
+    """
+    if cancel_event is None:
+        cancel_event = threading.Event()
+
+    session = get_onshape_session()
+    headers = {"Accept": "application/octet-stream"}
+    if compress:
+        headers["Accept-Encoding"] = "gzip, deflate"
+    else:
+        headers["Accept-Encoding"] = "identity"
+        if ranged:
+            headers["Range"] = f"bytes=0-{ONSHAPE_RANGE_SIZE - 1}"
+
+    lock = threading.Lock()
+    written = 0
+    total = 0
+    path = dest_path
+
+    def on_bytes(count):
+        nonlocal written
+        with lock:
+            written += count
+            done = written
+        if progress:
+            progress(done, total)
+
+    try:
+        with session.get(url, auth=auth, headers=headers, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            range_total = _content_range_total(response)
+
+            if range_total is None:
+                # Whole file in one response. Content-Length of an encoded
+                # body counts compressed bytes, so the decoded total isn't known.
+                if not response.headers.get("Content-Encoding"):
+                    total = int(response.headers.get("Content-Length", 0))
+                if total:
+                    path = _spill_path(dest_path, total)
+                with open(path, 'wb') as f:
+                    if total:
+                        _preallocate(f, total)
+                    _copy_response(response, f, on_bytes, cancel_event)
+                    # Drop any reserved space a short response didn't fill
+                    f.truncate()
+                return path
+
+            # First range is in flight; size the file and fetch the rest alongside
+            total = range_total
+            path = _spill_path(dest_path, total)
+            with open(path, 'wb') as f:
+                _preallocate(f, total)
+
+            remaining = total - ONSHAPE_RANGE_SIZE
+            step = max(-(-remaining // ONSHAPE_RANGE_PARTS), ONSHAPE_RANGE_MIN_PART)
+            ranges = [
+                (start, min(start + step, total) - 1)
+                for start in range(ONSHAPE_RANGE_SIZE, total, step)
+            ]
+
+            # Redirects usually point at pre-signed storage URLs; only send the
+            # API credentials back to Onshape itself
+            range_url = response.url
+            range_auth = auth if range_url.startswith(ONSHAPE_HOST) else None
+
+            with ThreadPoolExecutor(max_workers=max(len(ranges), 1)) as executor:
+                futures = [
+                    executor.submit(_download_range, range_url, path, range_auth,
+                                    start, end, timeout, on_bytes, cancel_event)
+                    for start, end in ranges
+                ]
+                try:
+                    with open(path, 'r+b') as f:
+                        _copy_response(response, f, on_bytes, cancel_event)
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    cancel_event.set()
+                    raise
+    except BaseException:
+        # A spilled file isn't in the caller's directory; don't leave it
+        if path != dest_path and os.path.exists(path):
+            os.remove(path)
+        raise
+
+    return path
+
+
+def download_onshape_files(downloads, auth, timeout=(10, 300), progress=None, cancel_event=None,
+                           compress=False):
+    """
+    Download several Onshape exports concurrently
+
+    The requests share the pooled session, so they overlap their round trips
+    over a handful of kept-alive connections. If one download fails the
+    others are cancelled and the error is raised.
+
+    Args:
+        downloads: List of (url, dest_path) tuples
+        auth: Auth from onshape_auth()
+        timeout: (connect, read) timeouts in seconds
+        progress: Optional callback(files_done, files_total)
+        cancel_event: Optional threading.Event to stop all downloads
+        compress: Request gzip/deflate encoded transfers
+
+    Returns:
+        List of downloaded file paths, in the order given; as with
+        download_onshape_file, a large export may be somewhere else
+    """
+    if cancel_event is None:
+        cancel_event = threading.Event()
+
+    done = 0
+    workers = min(ONSHAPE_MAX_PARALLEL, len(downloads))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(download_onshape_file, url, dest, auth, timeout,
+                            cancel_event=cancel_event, ranged=False, compress=compress)
+            for url, dest in downloads
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+                done += 1
+                if progress:
+                    progress(done, len(downloads))
+        except BaseException:
+            cancel_event.set()
+            executor.shutdown(wait=True)
+            # Remove the finished downloads that spilled outside their
+            # destination directory; the caller only cleans up that one
+            for future, (_, dest) in zip(futures, downloads):
+                if not future.cancelled() and future.exception() is None and future.result() != dest:
+                    os.remove(future.result())
+            raise
+
+    return [future.result() for future in futures]
+
+
+def start_onshape_translation(doc_id, workspace_id, element_id, format_name, auth, timeout=(10, 300),
+                              wvm="w"):
+    """
+    Ask Onshape to translate a Part Studio, returning the translation ID
+
+    wvm is "w" when workspace_id is a workspace, "v" when it is a version.
+    """
+    session = get_onshape_session()
+    url = f"{ONSHAPE_API_URL}/partstudios/d/{doc_id}/{wvm}/{workspace_id}/e/{element_id}/translations"
+    body = {"formatName": format_name, "storeInDocument": False}
+    response = session.post(url, auth=auth, json=body, headers={"Accept": "application/json"}, timeout=timeout)
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+def wait_for_onshape_translation(translation_id, auth, timeout=(10, 300), cancel_event=None):
+    """
+    Poll a translation until Onshape has finished it
+
+    Each poll is a short request, so a large part that takes minutes to
+    translate never holds a connection open waiting for the server. The
+    wait between polls doubles up to ONSHAPE_POLL_MAX seconds.
+
+    Args:
+        translation_id: ID from start_onshape_translation()
+        auth: Auth from onshape_auth()
+        timeout: (connect, read) timeouts in seconds for each poll
+        cancel_event: Optional threading.Event; when set polling stops with
+            DownloadCancelled.
+
+    Returns:
+        List of external data IDs holding the translated files
+    """
+    if cancel_event is None:
+        cancel_event = threading.Event()
+
+    session = get_onshape_session()
+    url = f"{ONSHAPE_API_URL}/translations/{translation_id}"
+    delay = ONSHAPE_POLL_INITIAL
+    while True:
+        response = session.get(url, auth=auth, headers={"Accept": "application/json"}, timeout=timeout)
+        response.raise_for_status()
+        status = response.json()
+
+        state = status.get("requestState")
+        if state == "DONE":
+            return status["resultExternalDataIds"]
+        if state == "FAILED":
+            raise RuntimeError(f"Onshape translation failed: {status.get('failureReason', 'unknown reason')}")
+
+        if cancel_event.wait(delay):
+            raise DownloadCancelled()
+        delay = min(delay * 2, ONSHAPE_POLL_MAX)
+
+
+def translate_onshape_element(doc_id, workspace_id, element_id, format_name, auth,
+                              timeout=(10, 300), cancel_event=None, wvm="w"):
+    """Translate a Part Studio and return the URL of the resulting file"""
+    translation_id = start_onshape_translation(
+        doc_id, workspace_id, element_id, format_name, auth, timeout, wvm
+    )
+    data_ids = wait_for_onshape_translation(translation_id, auth, timeout, cancel_event)
+    return f"{ONSHAPE_API_URL}/documents/d/{doc_id}/externaldata/{data_ids[0]}"
+
+
+# Largest value a QProgressBar can hold (a C++ int)
+PROGRESS_BAR_MAX = 2**31 - 1
+
+
+class OnshapeDownloadWorker(QtCore.QObject):
+    """Runs Onshape translations and downloads in a background thread"""
+
+    status = QtCore.Signal(str)
+    progress = QtCore.Signal('qint64', 'qint64')  # done, total; bytes can pass 2 GiB
+    finished = QtCore.Signal(list)
+    error = QtCore.Signal(str)
+    cancelled = QtCore.Signal()
+
+    def __init__(self, doc_id, workspace_id, exports, format_name, auth, timeout, compress=False,
+                 wvm="w"):
+        super().__init__()
+        self.doc_id = doc_id
+        self.workspace_id = workspace_id
+        self.wvm = wvm  # "w" workspace or "v" version
+        self.exports = exports  # List of (element_id, dest_path)
+        self.format_name = format_name
+        self.auth = auth
+        self.timeout = timeout
+        self.compress = compress
+        self.cancel_event = threading.Event()
+
+    def translate(self, element_id):
+        """Translate one Part Studio, returning the URL to download"""
+        return translate_onshape_element(
+            self.doc_id, self.workspace_id, element_id, self.format_name,
+            self.auth, self.timeout, self.cancel_event, self.wvm
+        )
+
+    def run(self):
+        """Translate and download the files, reporting through signals"""
+        import requests
+
+        try:
+            self.status.emit("Translating in Onshape...")
+            element_ids = [element_id for element_id, _ in self.exports]
+            with ThreadPoolExecutor(max_workers=min(ONSHAPE_MAX_PARALLEL, len(element_ids))) as executor:
+                try:
+                    urls = list(executor.map(self.translate, element_ids))
+                except BaseException:
+                    # Stop the other jobs polling
+                    self.cancel_event.set()
+                    raise
+            downloads = [(url, dest_path) for url, (_, dest_path) in zip(urls, self.exports)]
+
+            self.status.emit("Downloading from Onshape...")
+            if len(downloads) == 1:
+                # Single file: report byte progress
+                url, dest_path = downloads[0]
+                paths = [download_onshape_file(
+                    url, dest_path, self.auth, self.timeout,
+                    progress=self.progress.emit, cancel_event=self.cancel_event,
+                    compress=self.compress
+                )]
+            else:
+                # Several parts: fetch concurrently, report files completed
+                paths = download_onshape_files(
+                    downloads, self.auth, self.timeout,
+                    progress=self.progress.emit, cancel_event=self.cancel_event,
+                    compress=self.compress
+                )
+            self.finished.emit(paths)
+        except DownloadCancelled:
+            self.cancelled.emit()
+        except requests.HTTPError as e:
+            code, reason = e.response.status_code, e.response.reason
+            self.error.emit(f"API Error: {code} {reason}\nCheck your credentials and document permissions.")
+        except Exception as e:
+            self.error.emit(f"Import failed: {e}")
+
+    def cancel(self):
+        """Ask the translation or download to stop at the next poll/chunk"""
+        self.cancel_event.set()
+
+
 class OnshapeImportCommand:
     """Import parts from Onshape via API"""
 
-    def GetResources(self):
-        return {
-            'MenuText': 'Import from Onshape...',
-            'ToolTip': 'Download and import parts from Onshape using their API'
-        }
-
     def Activated(self):
         dialog = OnshapeImportDialog()
         dialog.exec_()
@@ -247,10 +896,32 @@ class OnshapeImportCommand:
 class OnshapeImportDialog(QtWidgets.QDialog):
     """Dialog for Onshape import"""
 
+    # Seconds to wait for the connection, and for each piece of the download
+    CONNECT_TIMEOUT = 10
+    READ_TIMEOUT = 300
+
+    # Milliseconds to wait after the last keystroke before parsing the URL
+    URL_PARSE_DELAY = 150
+
+    # Format choice -> (Onshape translation formatName, file extension,
+    # request a compressed transfer). Only the text formats are worth gzipping.
+    EXPORT_FORMATS = {
+        "STEP": ("STEP", ".step", True),
+        "STL": ("STL", ".stl", False),
+        "Parasolid": ("PARASOLID", ".x_t", False),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Import from Onshape")
         self.setMinimumWidth(500)
+        self._thread = None
+        self._worker = None
+        self._export_format = None
+        self._download_dir = None
+        # Whether the Workspace ID field holds a workspace ("w") or a
+        # version ("v"), as given by the last pasted URL
+        self._wvm = "w"
         self.setup_ui()
         self.load_credentials()
 
@@ -291,7 +962,12 @@ class OnshapeImportDialog(QtWidgets.QDialog):
 
         self.url_edit = QtWidgets.QLineEdit()
         self.url_edit.setPlaceholderText("https://cad.onshape.com/documents/...")
-        self.url_edit.textChanged.connect(self.parse_url)
+        # Parse once typing/pasting settles instead of on every keystroke
+        self._url_timer = QtCore.QTimer(self)
+        self._url_timer.setSingleShot(True)
+        self._url_timer.setInterval(self.URL_PARSE_DELAY)
+        self._url_timer.timeout.connect(lambda: self.parse_url(self.url_edit.text()))
+        self.url_edit.textChanged.connect(self._url_timer.start)
         doc_layout.addRow("Document URL:", self.url_edit)
 
         self.doc_id_edit = QtWidgets.QLineEdit()
@@ -300,10 +976,12 @@ class OnshapeImportDialog(QtWidgets.QDialog):
 
         self.workspace_edit = QtWidgets.QLineEdit()
         self.workspace_edit.setPlaceholderText("Workspace/Version ID")
+        # An ID typed in by hand is taken to be a workspace
+        self.workspace_edit.textEdited.connect(self._on_workspace_edited)
         doc_layout.addRow("Workspace ID:", self.workspace_edit)
 
         self.element_edit = QtWidgets.QLineEdit()
-        self.element_edit.setPlaceholderText("Element ID (Part Studio)")
+        self.element_edit.setPlaceholderText("Element ID(s) (Part Studio), comma separated")
         doc_layout.addRow("Element ID:", self.element_edit)
 
         layout.addWidget(doc_group)
@@ -313,58 +991,73 @@ class OnshapeImportDialog(QtWidgets.QDialog):
         export_layout = QtWidgets.QFormLayout(export_group)
 
         self.format_combo = QtWidgets.QComboBox()
-        self.format_combo.addItems(["STEP", "STL", "Parasolid"])
+        self.format_combo.addItems(list(self.EXPORT_FORMATS))
         export_layout.addRow("Format:", self.format_combo)
 
         layout.addWidget(export_group)
 
+        # Translation/download progress (shown while the export is being fetched)
+        self.status_label = QtWidgets.QLabel()
+        self.status_label.setVisible(False)
+        layout.addWidget(self.status_label)
+        self.progress_bar = QtWidgets.QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
         # Buttons
         button_layout = QtWidgets.QHBoxLayout()
-        import_btn = QtWidgets.QPushButton("Import")
-        import_btn.clicked.connect(self.do_import)
+        self.import_btn = QtWidgets.QPushButton("Import")
+        self.import_btn.clicked.connect(self.do_import)
         cancel_btn = QtWidgets.QPushButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
         button_layout.addStretch()
-        button_layout.addWidget(import_btn)
+        button_layout.addWidget(self.import_btn)
         button_layout.addWidget(cancel_btn)
         layout.addLayout(button_layout)
 
     def parse_url(self, url):
         """Parse Onshape URL to extract IDs"""
-        # URL format: https://cad.onshape.com/documents/{did}/w/{wid}/e/{eid}
-        try:
-            if "/documents/" in url:
-                parts = url.split("/documents/")[1].split("/")
-                if len(parts) >= 1:
-                    self.doc_id_edit.setText(parts[0])
-                if len(parts) >= 3 and parts[1] in ['w', 'v']:
-                    self.workspace_edit.setText(parts[2])
-                if len(parts) >= 5 and parts[3] == 'e':
-                    self.element_edit.setText(parts[4].split("?")[0])
-        except:
-            pass
+        url = url.strip()
+        if url.startswith(ONSHAPE_HOST + "/documents/"):
+            # Common case: match in place right after the host, no scan
+            match = _ONSHAPE_URL_RE.match(url, len(ONSHAPE_HOST))
+        elif "/documents/" in url:
+            # Enterprise domains (company.onshape.com) and pasted fragments
+            match = _ONSHAPE_URL_RE.search(url)
+        else:
+            return
+        if not match:
+            return
+        doc_id, wvm, workspace_id, element_id = match.groups()
+        # Don't let the ID fields feed back into the URL field's handlers
+        blocker = QtCore.QSignalBlocker(self.url_edit)
+        self._set_if_changed(self.doc_id_edit, doc_id)
+        if workspace_id:
+            self._wvm = wvm
+            self._set_if_changed(self.workspace_edit, workspace_id)
+        if element_id:
+            self._set_if_changed(self.element_edit, element_id)
+        del blocker
+
+    def _on_workspace_edited(self, text):
+        """Treat a hand-entered Workspace ID as a workspace"""
+        self._wvm = "w"
+
+    @staticmethod
+    def _set_if_changed(edit, text):
+        """Set a line edit's text, skipping the signal/repaint if it's the same"""
+        if edit.text() != text:
+            edit.setText(text)
 
     def load_credentials(self):
         """Load saved credentials"""
-        cred_file = os.path.join(os.path.expanduser("~"), ".onshape_credentials.json")
-        if os.path.exists(cred_file):
-            try:
-                with open(cred_file, 'r') as f:
-                    creds = json.load(f)
-                    self.access_key_edit.setText(creds.get("access_key", ""))
-                    self.secret_key_edit.setText(creds.get("secret_key", ""))
-            except:
-                pass
+        access_key, secret_key = load_onshape_credentials()
+        self.access_key_edit.setText(access_key)
+        self.secret_key_edit.setText(secret_key)
 
     def save_credentials(self):
-        """Save credentials to file"""
-        cred_file = os.path.join(os.path.expanduser("~"), ".onshape_credentials.json")
-        creds = {
-            "access_key": self.access_key_edit.text(),
-            "secret_key": self.secret_key_edit.text()
-        }
-        with open(cred_file, 'w') as f:
-            json.dump(creds, f)
+        """Save credentials (OS keyring when available)"""
+        save_onshape_credentials(self.access_key_edit.text(), self.secret_key_edit.text())
 
     def do_import(self):
         """Perform the import from Onshape"""
@@ -382,65 +1075,142 @@ class OnshapeImportDialog(QtWidgets.QDialog):
             self.save_credentials()
 
         # Export format
-        format_map = {"STEP": "STEP", "STL": "STL", "Parasolid": "PARASOLID"}
-        export_format = format_map[self.format_combo.currentText()]
+        export_format, ext, compress = self.EXPORT_FORMATS[self.format_combo.currentText()]
 
         try:
-            FreeCAD.Console.PrintMessage("Requesting export from Onshape...\n")
-
-            # Build API request
-            # Onshape API endpoint for part studio export
-            base_url = "https://cad.onshape.com/api/v5"
-            endpoint = f"/partstudios/d/{doc_id}/w/{workspace_id}/e/{element_id}/stl"
-
-            if export_format == "STEP":
-                endpoint = f"/partstudios/d/{doc_id}/w/{workspace_id}/e/{element_id}/step"
-            elif export_format == "PARASOLID":
-                endpoint = f"/partstudios/d/{doc_id}/w/{workspace_id}/e/{element_id}/parasolid"
-
-            url = base_url + endpoint
-
-            # Create auth header (Basic auth with access:secret)
-            credentials = f"{access_key}:{secret_key}"
-            encoded_creds = base64.b64encode(credentials.encode()).decode()
-
-            req = urllib.request.Request(url)
-            req.add_header("Authorization", f"Basic {encoded_creds}")
-            req.add_header("Accept", "application/octet-stream")
-
-            # Download the file
-            FreeCAD.Console.PrintMessage(f"Downloading from Onshape...\n")
-
-            with urllib.request.urlopen(req, timeout=60) as response:
-                data = response.read()
-
-            # Save to temp file
-            ext = ".step" if export_format == "STEP" else ".stl" if export_format == "STL" else ".x_t"
-            temp_file = os.path.join(tempfile.gettempdir(), f"onshape_import{ext}")
-
-            with open(temp_file, 'wb') as f:
-                f.write(data)
+            import requests
+        except ImportError:
+            QtWidgets.QMessageBox.critical(
+                self, "Error",
+                "The 'requests' package is required for Onshape import.\n"
+                "Install with: pip install requests"
+            )
+            return
 
-            FreeCAD.Console.PrintMessage(f"Downloaded to {temp_file}\n")
+        # Several Part Studios of the same document can be imported at once
+        element_ids = [e for e in element_id.replace(",", " ").split() if e]
+
+        # A private directory for this import's files; the shared temp
+        # directories are writable by everyone
+        self._download_dir = tempfile.mkdtemp(prefix="onshape_import_", dir=fast_temp_dir())
+        exports = []
+        for eid in element_ids:
+            suffix = "" if len(element_ids) == 1 else f"_{eid}"
+            temp_file = os.path.join(self._download_dir, f"onshape_import{suffix}{ext}")
+            exports.append((eid, temp_file))
+
+        # Translate and download the files (Basic auth with access:secret) in
+        # a background thread so the dialog stays responsive and can show progress
+        self._export_format = export_format
+
+        self._worker = OnshapeDownloadWorker(
+            doc_id, workspace_id, exports, export_format,
+            onshape_auth(access_key, secret_key),
+            (self.CONNECT_TIMEOUT, self.READ_TIMEOUT), compress, self._wvm
+        )
+        self._thread = QtCore.QThread(self)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.status.connect(self.on_download_status)
+        self._worker.progress.connect(self.on_download_progress)
+        self._worker.finished.connect(self.on_download_finished)
+        self._worker.error.connect(self.on_download_error)
+        self._worker.cancelled.connect(self.on_download_cancelled)
+        for signal in (self._worker.finished, self._worker.error, self._worker.cancelled):
+            signal.connect(self._thread.quit)
+
+        self.import_btn.setEnabled(False)
+        self.progress_bar.setRange(0, 0)  # Busy until the size is known
+        self.progress_bar.setVisible(True)
+        self.status_label.setVisible(True)
+        self._thread.start()
+
+    def on_download_status(self, message):
+        """Show which stage the import worker is in"""
+        FreeCAD.Console.PrintMessage(f"{message}\n")
+        self.status_label.setText(message)
+
+    def on_download_progress(self, done, total):
+        """Update the progress bar from the download worker"""
+        if total > 0:
+            # QProgressBar only takes 32-bit ints; show large byte counts
+            # in tenths of a percent
+            if total > PROGRESS_BAR_MAX:
+                done, total = done * 1000 // total, 1000
+            self.progress_bar.setRange(0, total)
+            self.progress_bar.setValue(done)
+
+    def on_download_finished(self, temp_files):
+        """Import the downloaded exports into FreeCAD"""
+        self._cleanup_download()
 
-            # Import into FreeCAD
-            if export_format in ["STEP", "PARASOLID"]:
-                Part.insert(temp_file, FreeCAD.ActiveDocument.Name if FreeCAD.ActiveDocument else "Onshape_Import")
-            else:
-                # STL - convert to solid
-                converter = STLToSolidCommand()
-                converter.convert_mesh_to_solid(temp_file)
+        try:
+            for temp_file in temp_files:
+                FreeCAD.Console.PrintMessage(f"Importing {os.path.basename(temp_file)}\n")
+
+                # Import into FreeCAD
+                if self._export_format in ["STEP", "PARASOLID"]:
+                    import Part
+                    Part.insert(temp_file, FreeCAD.ActiveDocument.Name if FreeCAD.ActiveDocument else "Onshape_Import")
+                else:
+                    # STL - convert to solid
+                    converter = get_stl_converter()
+                    converter.convert_mesh_to_solid(temp_file)
 
             FreeCAD.Console.PrintMessage("Import complete!\n")
             self.accept()
 
-        except urllib.error.HTTPError as e:
-            FreeCAD.Console.PrintError(f"HTTP Error {e.code}: {e.reason}\n")
-            QtWidgets.QMessageBox.critical(self, "Error", f"API Error: {e.code} {e.reason}\nCheck your credentials and document permissions.")
         except Exception as e:
             FreeCAD.Console.PrintError(f"Import failed: {e}\n")
             QtWidgets.QMessageBox.critical(self, "Error", f"Import failed: {e}")
 
+        finally:
+            # The exports may sit in RAM-backed /dev/shm; free them
+            for temp_file in temp_files:
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+            self._remove_download_dir()
+
+    def on_download_error(self, message):
+        """Report a failed download"""
+        self._cleanup_download()
+        self._remove_download_dir()
+        FreeCAD.Console.PrintError(f"{message}\n")
+        QtWidgets.QMessageBox.critical(self, "Error", message)
+
+    def on_download_cancelled(self):
+        """Close the dialog once a cancelled download has stopped"""
+        self._cleanup_download()
+        self._remove_download_dir()
+        FreeCAD.Console.PrintMessage("Onshape download cancelled\n")
+        super().reject()
+
+    def _cleanup_download(self):
+        """Wait for the worker thread to exit and reset the UI"""
+        if self._thread:
+            self._thread.quit()
+            self._thread.wait()
+            self._thread.deleteLater()
+            self._worker.deleteLater()
+        self._thread = None
+        self._worker = None
+        self.progress_bar.setVisible(False)
+        self.status_label.setVisible(False)
+        self.import_btn.setEnabled(True)
+
+    def _remove_download_dir(self):
+        """Delete this import's download directory and what is left in it"""
+        if self._download_dir:
+            shutil.rmtree(self._download_dir, ignore_errors=True)
+        self._download_dir = None
+
+    def reject(self):
+        """Cancel a running download instead of closing underneath it"""
+        if self._worker is not None:
+            self._worker.cancel()
+            return
+        super().reject()
+
     def IsActive(self):
         return True
 
@@ -452,12 +1222,6 @@ class OnshapeImportDialog(QtWidgets.QDialog):
 class SolidWorksImportCommand:
     """Helper for SolidWorks file import"""
 
-    def GetResources(self):
-        return {
-            'MenuText': 'Import SolidWorks File...',
-            'ToolTip': 'Convert and import SolidWorks files'
-        }
-
     def Activated(self):
         dialog = SolidWorksImportDialog()
         dialog.exec_()
@@ -466,6 +1230,55 @@ class SolidWorksImportCommand:
         return True
 
 
+# SolidWorks version found by the last successful check. Attaching to (or
+# launching) SolidWorks over COM takes seconds, so it is only done once.
+_solidworks_version = None
+
+
+class SolidWorksCheckWorker(QtCore.QObject):
+    """Looks for SolidWorks over COM in a background thread"""
+
+    found = QtCore.Signal(str)
+    missing = QtCore.Signal(str, str)
+
+    def run(self):
+        """Attach to SolidWorks and report its version"""
+        global _solidworks_version
+        try:
+            import pythoncom
+            import win32com.client
+        except ImportError:
+            self.missing.emit("✗ pywin32 not installed. Install with: pip install pywin32", "orange")
+            return
+
+        # COM must be initialised on every thread that uses it
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+        try:
+            sw = win32com.client.Dispatch("SldWorks.Application")
+            _solidworks_version = sw.RevisionNumber()
+            # Only the version string outlives this thread; the COM proxy
+            # belongs to this thread's apartment
+            del sw
+            self.found.emit(_solidworks_version)
+        except Exception:
+            self.missing.emit("✗ SolidWorks not found or not accessible", "red")
+        finally:
+            pythoncom.CoUninitialize()
+
+
+# SolidWorks checks whose dialog closed while they were running, as
+# (thread, worker); kept so the thread isn't destroyed before it ends
+_orphaned_checks = set()
+
+
+def _release_check(thread, worker):
+    """Drop an orphaned SolidWorks check once its thread has finished"""
+    if (thread, worker) in _orphaned_checks:
+        _orphaned_checks.discard((thread, worker))
+        thread.deleteLater()
+        worker.deleteLater()
+
+
 class SolidWorksImportDialog(QtWidgets.QDialog):
     """Dialog for SolidWorks import options"""
 
@@ -473,6 +1286,8 @@ class SolidWorksImportDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.setWindowTitle("Import SolidWorks File")
         self.setMinimumWidth(500)
+        self._check_thread = None
+        self._check_worker = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -540,18 +1355,65 @@ class SolidWorksImportDialog(QtWidgets.QDialog):
 
     def check_solidworks(self):
         """Check if SolidWorks is installed and available for COM automation"""
-        try:
-            import win32com.client
-            sw = win32com.client.Dispatch("SldWorks.Application")
-            version = sw.RevisionNumber()
-            self.sw_status.setText(f"✓ SolidWorks {version} found! You can use it to export STEP files.")
-            self.sw_status.setStyleSheet("color: green;")
-        except ImportError:
-            self.sw_status.setText("✗ pywin32 not installed. Install with: pip install pywin32")
-            self.sw_status.setStyleSheet("color: orange;")
-        except Exception as e:
-            self.sw_status.setText("✗ SolidWorks not found or not accessible")
-            self.sw_status.setStyleSheet("color: red;")
+        if _solidworks_version is not None:
+            self.on_solidworks_found(_solidworks_version)
+            return
+
+        # The COM attach can take seconds; keep the dialog responsive
+        self.check_sw_btn.setEnabled(False)
+        self.sw_status.setText("Checking for SolidWorks...")
+        self.sw_status.setStyleSheet("")
+
+        # No parent: the thread may outlive the dialog (see done())
+        self._check_worker = SolidWorksCheckWorker()
+        self._check_thread = QtCore.QThread()
+        self._check_worker.moveToThread(self._check_thread)
+        self._check_thread.started.connect(self._check_worker.run)
+        self._check_worker.found.connect(self.on_solidworks_found)
+        self._check_worker.missing.connect(self.on_solidworks_missing)
+        # quit() directly from the worker thread, not queued to a GUI
+        # event loop that may be busy
+        for signal in (self._check_worker.found, self._check_worker.missing):
+            signal.connect(self._check_thread.quit, QtCore.Qt.DirectConnection)
+        self._check_thread.finished.connect(self._cleanup_check)
+        self._check_thread.start()
+
+    def on_solidworks_found(self, version):
+        """Show the SolidWorks version found"""
+        self.sw_status.setText(f"✓ SolidWorks {version} found! You can use it to export STEP files.")
+        self.sw_status.setStyleSheet("color: green;")
+
+    def on_solidworks_missing(self, message, color):
+        """Show why SolidWorks couldn't be used"""
+        self.sw_status.setText(message)
+        self.sw_status.setStyleSheet(f"color: {color};")
+
+    def _cleanup_check(self):
+        """Release the finished check thread"""
+        if self._check_thread is None:
+            return  # Handed off by done()
+        self._check_thread.deleteLater()
+        self._check_worker.deleteLater()
+        self._check_thread = None
+        self._check_worker = None
+        self.check_sw_btn.setEnabled(True)
+
+    def done(self, result):
+        """Close without waiting for a running SolidWorks check"""
+        if self._check_thread is not None:
+            # The COM attach may be starting SolidWorks; rather than block
+            # the GUI on it, cut the check loose and let it end on its own
+            thread, worker = self._check_thread, self._check_worker
+            self._check_thread = None
+            self._check_worker = None
+            worker.found.disconnect(self.on_solidworks_found)
+            worker.missing.disconnect(self.on_solidworks_missing)
+            thread.finished.disconnect(self._cleanup_check)
+            _orphaned_checks.add((thread, worker))
+            thread.finished.connect(functools.partial(_release_check, thread, worker))
+            if thread.isFinished():
+                _release_check(thread, worker)
+        super().done(result)
 
     def do_import(self):
         filename = self.file_edit.text()
@@ -560,6 +1422,8 @@ class SolidWorksImportDialog(QtWidgets.QDialog):
             return
 
         try:
+            import Part
+
             doc = FreeCAD.ActiveDocument
             if not doc:
                 name = os.path.splitext(os.path.basename(filename))[0]
@@ -578,14 +1442,118 @@ class SolidWorksImportDialog(QtWidgets.QDialog):
 # BATCH CONVERTER
 # ============================================================================
 
+# Script run by headless FreeCADCmd processes during batch conversion. It
+# builds the solid for one mesh file and saves it as BREP, so several meshes
+# can be sewn at once on separate cores.
+MESH_TO_BREP_SCRIPT = '''
+import os
+import json
+import Mesh
+import Part
+
+input_file, output_file, tolerance, sewing = json.loads(os.environ["MESH_TO_BREP_ARGS"])
+
+mesh = Mesh.Mesh(input_file)
+shape = Part.Shape()
+shape.makeShapeFromMesh(mesh.Topology, tolerance)
+del mesh
+
+if sewing:
+    shape.sewShape()
+
+try:
+    shape = Part.makeSolid(shape)
+except Exception:
+    pass  # Keep the shell
+
+shape.exportBrep(output_file)
+'''
+
+
+# Seconds one FreeCADCmd build may take before it is given up as hung
+MESH_TO_BREP_TIMEOUT = 600
+
+
+def find_freecad_cmd():
+    """Locate the headless FreeCADCmd executable of this FreeCAD install"""
+    bin_dir = os.path.join(FreeCAD.getHomePath(), "bin")
+    for name in ("FreeCADCmd.exe", "FreeCADCmd", "freecadcmd"):
+        path = os.path.join(bin_dir, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _build_solid_brep(freecad_cmd, script_path, filename, output_file, tolerance, sewing):
+    """Run MESH_TO_BREP_SCRIPT for one file; returns the BREP path or None"""
+    env = dict(os.environ)
+    env["MESH_TO_BREP_ARGS"] = json.dumps([filename, output_file, tolerance, sewing])
+    name = os.path.basename(filename)
+    try:
+        result = subprocess.run(
+            [freecad_cmd, script_path], env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            timeout=MESH_TO_BREP_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        FreeCAD.Console.PrintWarning(f"Solid build for {name} timed out\n")
+        return None
+    except Exception as e:
+        FreeCAD.Console.PrintWarning(f"Solid build for {name} failed: {e}\n")
+        return None
+    if result.returncode != 0:
+        # Only decode the output when it is going to be shown
+        detail = result.stderr.decode('utf-8', 'replace').strip()
+        FreeCAD.Console.PrintWarning(f"Solid build for {name} failed: {detail[-500:]}\n")
+        return None
+    return output_file if os.path.exists(output_file) else None
+
+
+def build_solids_in_parallel(filenames, work_dir, tolerance=0.1, sewing=True):
+    """
+    Build solids for several mesh files at once in FreeCADCmd processes
+
+    Separate processes are used because the mesh/OCCT calls hold the GIL and
+    the GUI process must not be forked. The threads here only wait on them.
+
+    Args:
+        filenames: Mesh files to convert
+        work_dir: Directory for the intermediate BREP files
+        tolerance: Mesh to shape tolerance
+        sewing: Sew the shape before making the solid
+
+    Returns:
+        Dict of filename -> BREP path (None where the build failed), or an
+        empty dict if FreeCADCmd isn't available
+    """
+    freecad_cmd = find_freecad_cmd()
+    if not freecad_cmd:
+        return {}
+
+    script_path = os.path.join(work_dir, 'mesh_to_brep.py')
+    with open(script_path, 'w') as f:
+        f.write(MESH_TO_BREP_SCRIPT)
+
+    results = {}
+    workers = min(os.cpu_count() or 1, len(filenames))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for i, filename in enumerate(filenames):
+            output_file = os.path.join(work_dir, f"solid_{i}.brep")
+            future = executor.submit(
+                _build_solid_brep, freecad_cmd, script_path, filename, output_file, tolerance, sewing
+            )
+            futures[future] = filename
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
 class BatchConvertCommand:
     """Batch convert multiple files"""
 
-    def GetResources(self):
-        return {
-            'MenuText': 'Batch Convert...',
-            'ToolTip': 'Convert multiple STL/OBJ files to solids at once'
-        }
+    # Write the collected console output at least every this many files
+    LOG_FLUSH_FILES = 16
 
     def Activated(self):
         filenames, _ = QtWidgets.QFileDialog.getOpenFileNames(
@@ -598,27 +1566,41 @@ class BatchConvertCommand:
         if not filenames:
             return
 
-        converter = STLToSolidCommand()
+        converter = get_stl_converter()
         success = 0
         failed = 0
 
-        for filename in filenames:
-            FreeCAD.Console.PrintMessage(f"\nConverting: {os.path.basename(filename)}\n")
-            result = converter.convert_mesh_to_solid(filename)
-            if result:
-                success += 1
-            else:
-                failed += 1
+        # Report progress in batches rather than repainting per line
+        console = BufferedConsole()
+
+        # Build the solids on all cores first; only adding them to the
+        # document has to happen here in the GUI process
+        work_dir = tempfile.mkdtemp(prefix='batch_convert_', dir=fast_temp_dir())
+        try:
+            breps = {}
+            if len(filenames) > 1:
+                FreeCAD.Console.PrintMessage(f"Building {len(filenames)} solids in parallel...\n")
+                breps = build_solids_in_parallel(filenames, work_dir)
+
+            for index, filename in enumerate(filenames, 1):
+                console.PrintMessage(f"\nConverting: {os.path.basename(filename)}\n")
+                result = converter.convert_mesh_to_solid(
+                    filename, shape_file=breps.get(filename), console=console
+                )
+                if result:
+                    success += 1
+                else:
+                    failed += 1
+
+                if index % self.LOG_FLUSH_FILES == 0:
+                    console.flush()
+                else:
+                    console.flush_if_due()
+        finally:
+            console.flush()
+            shutil.rmtree(work_dir, ignore_errors=True)
 
         FreeCAD.Console.PrintMessage(f"\n=== Batch Complete: {success} success, {failed} failed ===\n")
 
     def IsActive(self):
         return True
-
-
-# Register commands
-FreeCADGui.addCommand('Converter_STLToSolid', STLToSolidCommand())
-FreeCADGui.addCommand('Converter_STLToSolidAdvanced', STLToSolidAdvancedCommand())
-FreeCADGui.addCommand('Converter_OnshapeImport', OnshapeImportCommand())
-FreeCADGui.addCommand('Converter_SolidWorksImport', SolidWorksImportCommand())
-FreeCADGui.addCommand('Converter_BatchConvert', BatchConvertCommand())
@@ -0,0 +1,144 @@
+"""
+Background conversion for the Universal Converter import commands
+Runs Blender/ODA conversions off the GUI thread and inserts the results
+"""
+
+import os
+import threading
+
+import FreeCAD
+import FreeCADGui
+
+from PySide2 import QtWidgets, QtCore
+
+
+class ConversionWorker(QtCore.QObject):
+    """Converts files in a background thread, reporting each through signals"""
+
+    converted = QtCore.Signal(str, str)  # input file, converted file ('' if failed)
+    error = QtCore.Signal(str)
+    finished = QtCore.Signal()
+
+    def __init__(self, converter, filenames, quiet=False):
+        super().__init__()
+        self.converter = converter
+        self.filenames = filenames
+        self.quiet = quiet
+        self.cancel_event = threading.Event()
+
+    def run(self):
+        """Convert the files, in order, reporting through signals"""
+        converter = self.converter
+        prepared = {}
+        try:
+            prepared = converter.prepare_batch(self.filenames)
+
+            # One at a time: Blender files share the one process kept
+            # running for the whole batch, and ODA files were all converted
+            # together by prepare_batch() above
+            with converter.blender:
+                for filename in self.filenames:
+                    if self.cancel_event.is_set():
+                        break
+                    converted = converter.convert(filename, quiet=self.quiet, prepared=prepared)
+                    self.converted.emit(filename, converted or '')
+        except Exception as e:
+            self.error.emit(f"Conversion failed: {e}")
+        finally:
+            # ODA results of files a cancel or error left unconverted
+            converter.remove_prepared(prepared)
+            self.finished.emit()
+
+    def cancel(self):
+        """Stop after the file currently being converted"""
+        self.cancel_event.set()
+
+
+class ImportJob(QtCore.QObject):
+    """
+    Import files through a UniversalConverter without blocking the GUI
+
+    The conversions run in a ConversionWorker thread. This object lives in
+    the GUI thread, so the worker's signals arrive here queued and each
+    converted file is inserted into the document on the GUI thread.
+    A progress dialog shows how far it got and can cancel the rest.
+
+    In batch mode output is kept to errors and a summary, the inserts are
+    one undo step and the document is recomputed once at the end.
+    """
+
+    def __init__(self, converter, filenames, batch=False):
+        super().__init__()
+        self.converter = converter
+        self.filenames = filenames
+        self.batch = batch
+        self.success = 0
+        self.failed = 0
+        self.doc = None
+        self.running = False
+
+        self._worker = ConversionWorker(converter, filenames, quiet=batch)
+        self._thread = QtCore.QThread()
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.converted.connect(self.on_converted)
+        self._worker.error.connect(self.on_error)
+        self._worker.finished.connect(self.on_finished)
+
+        self._progress = QtWidgets.QProgressDialog(
+            f"Converting {len(filenames)} file(s)...", "Cancel", 0, len(filenames),
+            FreeCADGui.getMainWindow()
+        )
+        self._progress.setWindowTitle("Universal CAD Import")
+        self._progress.setWindowModality(QtCore.Qt.WindowModal)
+        self._progress.setMinimumDuration(0)
+        self._progress.setAutoClose(False)
+        self._progress.setAutoReset(False)
+        # Set the event directly: the worker's own thread is busy in run()
+        # and wouldn't get to a queued cancel() until it was done
+        self._progress.canceled.connect(self._worker.cancel_event.set)
+
+    def start(self):
+        """Start converting in the background"""
+        if self.batch:
+            # One undo step for the whole batch
+            self.doc = self.converter.get_document(self.filenames[0])
+            self.doc.openTransaction("Batch Import")
+        self._progress.setValue(0)
+        self.running = True
+        self._thread.start()
+
+    def on_converted(self, filename, converted):
+        """Insert one converted file into the document"""
+        doc = None
+        if converted:
+            doc = self.converter.insert_converted(
+                filename, converted, quiet=self.batch, defer_recompute=self.batch
+            )
+        if doc:
+            self.success += 1
+        else:
+            self.failed += 1
+            if self.batch:
+                FreeCAD.Console.PrintWarning(f"Not imported: {os.path.basename(filename)}\n")
+        self._progress.setValue(self.success + self.failed)
+
+    def on_error(self, message):
+        """Report a conversion run that failed as a whole"""
+        FreeCAD.Console.PrintError(f"{message}\n")
+
+    def on_finished(self):
+        """Wrap up once the worker is done"""
+        self._thread.quit()
+        self._thread.wait()
+        self._progress.close()
+        self.running = False
+
+        if self.batch:
+            self.doc.commitTransaction()
+            self.converter.finish_import(self.doc)
+            skipped = len(self.filenames) - self.success - self.failed
+            summary = f"{self.success} success, {self.failed} failed"
+            if skipped:
+                summary += f", {skipped} cancelled"
+            FreeCAD.Console.PrintMessage(f"\n=== Batch Import Complete: {summary} ===\n")
@@ -45,8 +45,10 @@ class ConverterBridgeWorkbench(FreeCADGui.Workbench):
 
     def Initialize(self):
         """Initialize the workbench"""
-        import ConverterCommands
-        import UniversalConverter
+        # Register lightweight proxies; the converter modules are imported
+        # the first time one of their commands runs
+        import LazyCommands
+        LazyCommands.register_commands()
 
         # Main toolbar - Universal Import is the star
         self.appendToolbar("Universal Converter", [
@@ -76,7 +78,8 @@ class ConverterBridgeWorkbench(FreeCADGui.Workbench):
             "Converter_OnshapeImport",
             "Converter_SolidWorksImport",
             "Separator",
-            "Converter_ShowFormats"
+            "Converter_ShowFormats",
+            "Converter_RescanTools"
         ])
 
         FreeCAD.Console.PrintMessage("Converter Bridge workbench initialized\n")
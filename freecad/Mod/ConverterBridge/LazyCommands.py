@@ -0,0 +1,87 @@
+"""
+Lazy command registration for the Converter Bridge workbench
+Registers the converter commands without importing their modules
+"""
+
+import FreeCADGui
+
+
+class LazyCommand:
+    """
+    Command proxy that imports its implementation on first use
+
+    The converter modules pull in Part, Mesh and the dialog code, which
+    isn't needed until a command is actually run, so only the menu text is
+    registered up front.
+    """
+
+    def __init__(self, module_name, class_name, resources):
+        self.module_name = module_name
+        self.class_name = class_name
+        self.resources = resources
+        self.command = None
+
+    def load(self):
+        """Import the implementing module and create the real command"""
+        if self.command is None:
+            module = __import__(self.module_name)
+            self.command = getattr(module, self.class_name)()
+        return self.command
+
+    def GetResources(self):
+        return self.resources
+
+    def Activated(self):
+        self.load().Activated()
+
+    def IsActive(self):
+        if self.command is None:
+            return True
+        return self.command.IsActive()
+
+
+# Command name -> (module, class, resources)
+CONVERTER_COMMANDS = {
+    'Converter_STLToSolid': ('ConverterCommands', 'STLToSolidCommand', {
+        'MenuText': 'STL to Solid',
+        'ToolTip': 'Convert an STL mesh file to a solid body'
+    }),
+    'Converter_STLToSolidAdvanced': ('ConverterCommands', 'STLToSolidAdvancedCommand', {
+        'MenuText': 'STL to Solid (Advanced)...',
+        'ToolTip': 'Convert STL with advanced options for tolerance and repair'
+    }),
+    'Converter_OnshapeImport': ('ConverterCommands', 'OnshapeImportCommand', {
+        'MenuText': 'Import from Onshape...',
+        'ToolTip': 'Download and import parts from Onshape using their API'
+    }),
+    'Converter_SolidWorksImport': ('ConverterCommands', 'SolidWorksImportCommand', {
+        'MenuText': 'Import SolidWorks File...',
+        'ToolTip': 'Convert and import SolidWorks files'
+    }),
+    'Converter_BatchConvert': ('ConverterCommands', 'BatchConvertCommand', {
+        'MenuText': 'Batch Convert...',
+        'ToolTip': 'Convert multiple STL/OBJ files to solids at once'
+    }),
+    'Converter_UniversalImport': ('UniversalConverter', 'UniversalImportCommand', {
+        'MenuText': 'Universal Import...',
+        'ToolTip': 'Import any CAD file format (auto-converts as needed)'
+    }),
+    'Converter_BatchUniversalImport': ('UniversalConverter', 'BatchUniversalImportCommand', {
+        'MenuText': 'Batch Universal Import...',
+        'ToolTip': 'Import multiple CAD files at once'
+    }),
+    'Converter_ShowFormats': ('UniversalConverter', 'ShowSupportedFormatsCommand', {
+        'MenuText': 'Supported Formats...',
+        'ToolTip': 'Show all supported CAD file formats'
+    }),
+    'Converter_RescanTools': ('UniversalConverter', 'RescanToolsCommand', {
+        'MenuText': 'Rescan Converter Tools',
+        'ToolTip': 'Search again for the ODA File Converter and CAD Exchanger'
+    }),
+}
+
+
+def register_commands():
+    """Register a LazyCommand for every converter command"""
+    for name, (module_name, class_name, resources) in CONVERTER_COMMANDS.items():
+        FreeCADGui.addCommand(name, LazyCommand(module_name, class_name, resources))
@@ -8,16 +8,178 @@ This module provides multiple conversion strategies.
 
 import os
 import re
+import mmap
 import json
+import types
+import functools
+import shutil
 import tempfile
-import urllib.request
-import urllib.parse
 import subprocess
 from pathlib import Path
 
 import FreeCAD
 
 
+# The header sits at the start of the file, normally in the first few KB;
+# the markers are only looked for this far into it
+HEADER_SEARCH_SIZE = 1024 * 1024
+
+# CAD Exchanger's command-line converter is looked for on PATH first, then
+# where it is normally installed
+CAD_EXCHANGER_EXECUTABLE = 'ExchangerConv'
+CAD_EXCHANGER_PATHS = [
+    r"C:\Program Files\CAD Exchanger\ExchangerConv.exe",
+    r"C:\Program Files (x86)\CAD Exchanger\ExchangerConv.exe",
+]
+
+# Section markers of the header, found together in one pass
+_HEADER_MARKER_RE = re.compile(rb'\*\*(PART1;|PART2;|PART3;|END_OF_HEADER)')
+
+# KEY=value; lines between **PART1; and **END_OF_HEADER, with the spaces
+# around the key and value and the trailing ';' left outside the groups, so
+# findall() yields finished (key, value) pairs
+_HEADER_LINE_RE = re.compile(
+    r'^[ \t]*(?P<key>[A-Za-z_][A-Za-z_0-9]*)[ \t]*=[ \t]*(?P<value>[^\r\n]*?)[ \t;\r]*$',
+    re.MULTILINE
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_header(path, mtime_ns, size):
+    """
+    Read the header fields of a Parasolid file
+
+    Cached on the file's path, modification time and size, so converting
+    the same unchanged file again doesn't re-read it; an edited file gets a
+    new key. The result is read-only since it is shared between callers.
+    """
+    if size == 0:
+        return types.MappingProxyType({})
+
+    # Map the file rather than reading it: only the pages the marker search
+    # touches get paged in, however large the model data after the header is
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        limit = min(size, HEADER_SEARCH_SIZE)
+        start = None
+        end = limit
+        for marker in _HEADER_MARKER_RE.finditer(mm, 0, limit):
+            if marker.group(1) == b'PART1;' and start is None:
+                start = marker.start()
+            elif marker.group(1) == b'END_OF_HEADER':
+                end = marker.start()
+                break
+        if start is None:
+            return types.MappingProxyType({})
+        # Decode the header once rather than every key and value on its own
+        header_text = mm[start:end].decode('latin-1')
+
+    return types.MappingProxyType(dict(_HEADER_LINE_RE.findall(header_text)))
+
+
+@functools.lru_cache(maxsize=1)
+def find_cad_exchanger():
+    """
+    Find the CAD Exchanger converter, or None if it isn't installed
+
+    Tools don't get installed mid-session, so the search runs once; call
+    find_cad_exchanger.cache_clear() to look again.
+    """
+    path = shutil.which(CAD_EXCHANGER_EXECUTABLE)
+    if path:
+        return path
+    for path in CAD_EXCHANGER_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def occ_reads_parasolid():
+    """
+    Check whether this FreeCAD's Part.read can load Parasolid at all
+
+    Part.read picks its reader from the file extension and rejects unknown
+    ones before reading anything, so an empty .x_t probe answers this
+    instantly. Only an "unknown extension" style failure means there is no
+    Parasolid reader; any other error came from an actual reader.
+    """
+    import Part
+
+    fd, probe = tempfile.mkstemp(suffix='.x_t')
+    os.close(fd)
+    try:
+        Part.read(probe)
+    except Exception as e:
+        return 'extension' not in str(e).lower()
+    finally:
+        os.remove(probe)
+    return True
+
+
+# Manual conversion instructions, keyed by _instruction_key(); only the
+# header line with the file details is formatted per call
+_INSTRUCTIONS_HEADER = """
+========================================
+PARASOLID CONVERSION INSTRUCTIONS
+========================================
+
+Source Application: {source}
+File: {path}
+
+"""
+
+_INSTRUCTION_TEMPLATES = {
+    'Onshape': """
+RECOMMENDED: Re-export from Onshape as STEP
+
+1. Open your Onshape document in a browser
+2. Right-click on the Part Studio tab
+3. Select "Export..."
+4. Choose format: STEP
+5. Click "Export"
+6. Download the .step file
+7. Import into FreeCAD: File -> Import
+
+This preserves the best geometry quality.
+""",
+    'SolidWorks': """
+RECOMMENDED: Re-export from SolidWorks as STEP
+
+1. Open the part in SolidWorks
+2. File -> Save As
+3. Change "Save as type" to STEP (*.step)
+4. Click Save
+5. Import into FreeCAD: File -> Import
+""",
+    None: """
+CONVERSION OPTIONS:
+
+1. ONLINE CONVERTER (Free):
+   - Go to https://cadexchanger.com/online/
+   - Upload your .x_t file
+   - Download as STEP
+   - Import into FreeCAD
+
+2. CAD EXCHANGER (30-day trial):
+   - Download from https://cadexchanger.com/
+   - Convert locally with full quality
+
+3. ORIGINAL APPLICATION:
+   - If you have access to the CAD software that
+     created this file, re-export as STEP
+""",
+}
+
+
+def _instruction_key(source):
+    """Map a header's APPL value to its _INSTRUCTION_TEMPLATES key"""
+    if source == 'Onshape':
+        return 'Onshape'
+    if 'SOLIDWORKS' in source.upper():
+        return 'SolidWorks'
+    return None
+
+
 class ParasolidConverter:
     """Convert Parasolid .x_t files to formats FreeCAD can read"""
 
@@ -29,17 +191,8 @@ class ParasolidConverter:
     def parse_header(self):
         """Parse the Parasolid file header"""
         try:
-            with open(self.input_file, 'r', errors='ignore') as f:
-                in_header = False
-                for line in f:
-                    if '**PART1;' in line:
-                        in_header = True
-                        continue
-                    if '**END_OF_HEADER' in line:
-                        break
-                    if in_header and '=' in line:
-                        key, _, value = line.partition('=')
-                        self.header[key.strip()] = value.strip().rstrip(';')
+            st = os.stat(self.input_file)
+            self.header = _load_header(os.path.abspath(self.input_file), st.st_mtime_ns, st.st_size)
 
             FreeCAD.Console.PrintMessage(f"Parasolid file info:\n")
             FreeCAD.Console.PrintMessage(f"  Application: {self.header.get('APPL', 'Unknown')}\n")
@@ -74,6 +227,11 @@ class ParasolidConverter:
         """
         FreeCAD.Console.PrintMessage("Checking FreeCAD/OpenCASCADE Parasolid support...\n")
 
+        # Don't let OCCT load a large file just to reject its format
+        if not occ_reads_parasolid():
+            FreeCAD.Console.PrintMessage("OpenCASCADE Parasolid translator not available.\n")
+            return None
+
         try:
             import Part
             # Try direct import (will fail without Parasolid translator)
@@ -90,27 +248,24 @@ class ParasolidConverter:
         Supports: CAD Exchanger CLI, OpenCASCADE draw, etc.
         """
         # Check for CAD Exchanger
-        cad_exchanger_paths = [
-            r"C:\Program Files\CAD Exchanger\ExchangerConv.exe",
-            r"C:\Program Files (x86)\CAD Exchanger\ExchangerConv.exe",
-        ]
-
-        for path in cad_exchanger_paths:
-            if os.path.exists(path):
-                FreeCAD.Console.PrintMessage(f"Found CAD Exchanger at {path}\n")
-                output_file = self.input_file.replace('.x_t', '.step')
-                try:
-                    result = subprocess.run(
-                        [path, self.input_file, output_file],
-                        capture_output=True,
-                        text=True,
-                        timeout=120
-                    )
-                    if os.path.exists(output_file):
-                        FreeCAD.Console.PrintMessage(f"Converted to {output_file}\n")
-                        return output_file
-                except Exception as e:
-                    FreeCAD.Console.PrintError(f"CAD Exchanger failed: {e}\n")
+        path = tool_path or find_cad_exchanger()
+        if not path:
+            return None
+
+        FreeCAD.Console.PrintMessage(f"Found CAD Exchanger at {path}\n")
+        output_file = str(Path(self.input_file).with_suffix('.step'))
+        try:
+            result = subprocess.run(
+                [path, self.input_file, output_file],
+                capture_output=True,
+                text=True,
+                timeout=120
+            )
+            if os.path.exists(output_file):
+                FreeCAD.Console.PrintMessage(f"Converted to {output_file}\n")
+                return output_file
+        except Exception as e:
+            FreeCAD.Console.PrintError(f"CAD Exchanger failed: {e}\n")
 
         return None
 
@@ -141,59 +296,8 @@ class ParasolidConverter:
         Provide manual conversion instructions based on source application
         """
         source = self.get_source_application()
-
-        instructions = f"""
-========================================
-PARASOLID CONVERSION INSTRUCTIONS
-========================================
-
-Source Application: {source}
-File: {self.input_file}
-
-"""
-        if source == 'Onshape':
-            instructions += """
-RECOMMENDED: Re-export from Onshape as STEP
-
-1. Open your Onshape document in a browser
-2. Right-click on the Part Studio tab
-3. Select "Export..."
-4. Choose format: STEP
-5. Click "Export"
-6. Download the .step file
-7. Import into FreeCAD: File -> Import
-
-This preserves the best geometry quality.
-"""
-        elif 'SolidWorks' in source or 'SOLIDWORKS' in source:
-            instructions += """
-RECOMMENDED: Re-export from SolidWorks as STEP
-
-1. Open the part in SolidWorks
-2. File -> Save As
-3. Change "Save as type" to STEP (*.step)
-4. Click Save
-5. Import into FreeCAD: File -> Import
-"""
-        else:
-            instructions += """
-CONVERSION OPTIONS:
-
-1. ONLINE CONVERTER (Free):
-   - Go to https://cadexchanger.com/online/
-   - Upload your .x_t file
-   - Download as STEP
-   - Import into FreeCAD
-
-2. CAD EXCHANGER (30-day trial):
-   - Download from https://cadexchanger.com/
-   - Convert locally with full quality
-
-3. ORIGINAL APPLICATION:
-   - If you have access to the CAD software that
-     created this file, re-export as STEP
-"""
-        return instructions
+        header = _INSTRUCTIONS_HEADER.format(source=source, path=self.input_file)
+        return header + _INSTRUCTION_TEMPLATES[_instruction_key(source)]
 
 
 def convert_parasolid_file(input_file, output_format='step'):
@@ -8,19 +8,25 @@ Integrates multiple conversion backends:
 """
 
 import os
+import re
 import sys
+import time
+import queue
+import threading
 import subprocess
+import collections
 import tempfile
 import shutil
 import json
+import hashlib
+import functools
+import types
 from pathlib import Path
 
 import FreeCAD
-import FreeCADGui
-import Part
-import Mesh
 
-from PySide2 import QtWidgets, QtCore, QtGui
+# Part, Mesh, FreeCADGui and PySide2 are imported where they are used, so
+# headless batch conversions don't pay for loading OCCT and Qt
 
 
 # ============================================================================
@@ -33,6 +39,15 @@ BLENDER_PATH = r"C:\Program Files\Blender Foundation\Blender 4.4\blender.exe"
 # ODA File Converter path
 ODA_CONVERTER_PATH = r"C:\Program Files\ODA\ODAFileConverter\ODAFileConverter.exe"
 
+# Executable names the ODA File Converter goes by on PATH
+ODA_EXECUTABLE_NAMES = ['ODAFileConverter', 'ODAFileConverter.exe']
+
+# Folders the ODA installer puts its per-version "ODAFileConverter*" folders in
+ODA_INSTALL_ROOTS = [
+    r"C:\Program Files\ODA",
+    r"C:\Program Files (x86)\ODA",
+]
+
 # Supported formats by converter
 FORMAT_HANDLERS = {
     # FreeCAD native
@@ -71,6 +86,157 @@ FORMAT_HANDLERS = {
     '.sat': 'online', '.sab': 'online',  # ACIS
 }
 
+# Bytes read from the start of a file to recognise its format by content;
+# one page, enough for an XML prolog before a COLLADA/X3D root element
+SNIFF_SIZE = 4096
+
+# (leading bytes, extension) for formats that begin with a fixed signature,
+# checked when a file's extension is missing or not one we know
+MAGIC_PREFIXES = (
+    (b'ISO-10303-21', '.step'),
+    (b'DBRep_DrawableShape', '.brep'),
+    (b'CASCADE Topology', '.brep'),
+    (b'Kaydara FBX Binary', '.fbx'),
+    (b'glTF', '.glb'),
+    (b'BLENDER', '.blend'),
+    (b'#VRML', '.wrl'),
+    (b'ply\n', '.ply'),
+    (b'ply\r\n', '.ply'),
+    (b'AC10', '.dwg'),
+    (b'**ABCDEFGHIJKLMNOPQRSTUVWXYZ', '.x_t'),
+    (b'solid', '.stl'),
+)
+
+# Signatures that aren't at a fixed offset
+_DXF_START_RE = re.compile(rb'\s*0\s*\r?\nSECTION')
+_XML_ROOT_RE = re.compile(rb'<(COLLADA|X3D)\b')
+
+
+def _read_head(path, size=SNIFF_SIZE):
+    """
+    Read the first size bytes of path and get its total size
+
+    Uses a raw descriptor and one positioned read, skipping the buffered
+    file object that open() would set up; os.read where there is no pread
+    (Windows), which reads from the start of a new descriptor all the same.
+
+    Returns:
+        (leading bytes, file size in bytes)
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if hasattr(os, 'pread'):
+            head = os.pread(fd, size, 0)
+        else:
+            head = os.read(fd, size)
+        return head, os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+
+def sniff_extension(path):
+    """
+    Recognise a file's format from its first bytes
+
+    Catches renamed files and files without an extension. Only a short
+    header is read, in pure Python, so no libmagic is needed.
+
+    Returns:
+        Extension (with the dot) for the format found, or None
+    """
+    try:
+        head, size = _read_head(path)
+    except OSError:
+        return None
+
+    for prefix, ext in MAGIC_PREFIXES:
+        if head.startswith(prefix):
+            return ext
+    if _DXF_START_RE.match(head):
+        return '.dxf'
+    xml_root = _XML_ROOT_RE.search(head)
+    if xml_root:
+        return '.dae' if xml_root.group(1) == b'COLLADA' else '.x3d'
+    # IGES: fixed 80-column records, the first one flagged S, sequence 1
+    if len(head) >= 80 and head[72:73] == b'S' and head[73:80].strip() == b'1':
+        return '.iges'
+    # Binary STL: 80-byte header, triangle count, then 50 bytes a triangle
+    if len(head) >= 84 and size == 84 + 50 * int.from_bytes(head[80:84], 'little'):
+        return '.stl'
+    return None
+
+
+# Formats listed to the user, by backend; read-only since it is shared
+SUPPORTED_FORMATS = types.MappingProxyType({
+    'native': ('.step', '.stp', '.iges', '.igs', '.brep', '.brp', '.stl', '.obj'),
+    'blender': ('.fbx', '.gltf', '.glb', '.dae', '.3ds', '.ply', '.usd', '.abc', '.x3d', '.wrl', '.blend'),
+    'oda': ('.dwg', '.dxf'),
+    'online': ('.x_t', '.x_b', '.catpart', '.catproduct', '.prt', '.sldprt', '.sldasm', '.ipt', '.iam', '.jt', '.sat'),
+})
+
+# File dialog filters for the universal import, built once from the above
+IMPORT_NAME_FILTERS = (
+    "All CAD Files ({})".format(' '.join('*' + f for formats in SUPPORTED_FORMATS.values() for f in formats)),
+    "STEP Files (*.step *.stp)",
+    "IGES Files (*.iges *.igs)",
+    "Mesh Files (*.stl *.obj *.ply)",
+    "Blender/Game (*.fbx *.gltf *.glb *.dae *.3ds)",
+    "DWG/DXF (*.dwg *.dxf)",
+    "Proprietary CAD (*.x_t *.sldprt *.catpart *.prt *.ipt)",
+    "All Files (*.*)",
+)
+
+# File dialog filters for the batch import
+BATCH_NAME_FILTERS = (
+    "All CAD Files (*.step *.stp *.iges *.igs *.stl *.obj *.fbx *.gltf *.dae *.3ds *.dwg *.dxf)",
+    "All Files (*.*)",
+)
+
+# Text of the supported formats message box
+SUPPORTED_FORMATS_TEXT = (
+    "═══════════════════════════════════════════\n"
+    "      SUPPORTED CAD FORMATS\n"
+    "═══════════════════════════════════════════\n\n"
+    "NATIVE (FreeCAD):\n"
+    "  " + ", ".join(SUPPORTED_FORMATS['native']) + "\n\n"
+    "VIA BLENDER:\n"
+    "  " + ", ".join(SUPPORTED_FORMATS['blender']) + "\n\n"
+    "VIA ODA CONVERTER:\n"
+    "  " + ", ".join(SUPPORTED_FORMATS['oda']) + "\n\n"
+    "ONLINE CONVERSION:\n"
+    "  " + ", ".join(SUPPORTED_FORMATS['online']) + "\n\n"
+    "═══════════════════════════════════════════\n"
+)
+
+
+def get_extension(path):
+    """
+    Get the lower-case extension of path, including the dot ('' if none)
+
+    Cheaper than os.path.splitext for routing many files: one reverse scan
+    and a slice, no tuple or root string.
+    """
+    dot = path.rfind('.')
+    if dot <= max(path.rfind('/'), path.rfind('\\')):
+        return ''
+    return path[dot:].lower()
+
+
+def get_format_handler(path, ext=None):
+    """
+    Get the FORMAT_HANDLERS backend for a file, 'unknown' if unsupported
+
+    Pass ext when the caller already has get_extension(path), so it isn't
+    worked out twice.
+    """
+    if ext is None:
+        ext = get_extension(path)
+    return FORMAT_HANDLERS.get(ext, 'unknown')
+
+
+def _no_message(message):
+    """Stand-in for FreeCAD.Console.PrintMessage when quiet is set"""
+
 
 # ============================================================================
 # BLENDER CONVERTER
@@ -78,129 +244,292 @@ FORMAT_HANDLERS = {
 
 BLENDER_CONVERT_SCRIPT = '''
 # Blender conversion script - run headless
+#   blender --background --python script.py -- input output [FORMAT]
+#       converts one file
+#   blender --background --python script.py -- --serve
+#       reads "input<TAB>output" lines from stdin and converts each one,
+#       answering with a "__DONE__<TAB>0<TAB>output" or
+#       "__DONE__<TAB>1<TAB>error" line, until stdin closes
 import bpy
 import sys
 import os
+import argparse
+
+
+# Extension -> importer/exporter, looked up once per file
+IMPORTERS = {
+    '.fbx': lambda path: bpy.ops.import_scene.fbx(filepath=path),
+    '.gltf': lambda path: bpy.ops.import_scene.gltf(filepath=path),
+    '.glb': lambda path: bpy.ops.import_scene.gltf(filepath=path),
+    '.dae': lambda path: bpy.ops.wm.collada_import(filepath=path),
+    '.3ds': lambda path: bpy.ops.import_scene.autodesk_3ds(filepath=path),
+    '.obj': lambda path: bpy.ops.wm.obj_import(filepath=path),
+    '.ply': lambda path: bpy.ops.wm.ply_import(filepath=path),
+    '.stl': lambda path: bpy.ops.wm.stl_import(filepath=path),
+    '.usd': lambda path: bpy.ops.wm.usd_import(filepath=path),
+    '.usda': lambda path: bpy.ops.wm.usd_import(filepath=path),
+    '.usdc': lambda path: bpy.ops.wm.usd_import(filepath=path),
+    '.abc': lambda path: bpy.ops.wm.alembic_import(filepath=path),
+    '.svg': lambda path: bpy.ops.import_curve.svg(filepath=path),
+    '.x3d': lambda path: bpy.ops.import_scene.x3d(filepath=path),
+    '.wrl': lambda path: bpy.ops.import_scene.x3d(filepath=path),
+    '.blend': lambda path: bpy.ops.wm.open_mainfile(filepath=path),
+    # DXF import via io_import_dxf addon
+    '.dxf': lambda path: bpy.ops.import_scene.dxf(filepath=path),
+}
 
-# Get arguments after "--"
-argv = sys.argv
-argv = argv[argv.index("--") + 1:]
-input_file = argv[0]
-output_file = argv[1]
-output_format = argv[2] if len(argv) > 2 else 'STL'
+EXPORTERS = {
+    '.stl': lambda path: bpy.ops.wm.stl_export(filepath=path, export_selected_objects=False),
+    '.obj': lambda path: bpy.ops.wm.obj_export(filepath=path),
+    '.ply': lambda path: bpy.ops.wm.ply_export(filepath=path),
+    '.gltf': lambda path: bpy.ops.export_scene.gltf(filepath=path),
+    '.glb': lambda path: bpy.ops.export_scene.gltf(filepath=path),
+    '.fbx': lambda path: bpy.ops.export_scene.fbx(filepath=path),
+    '.dae': lambda path: bpy.ops.wm.collada_export(filepath=path),
+    '.usd': lambda path: bpy.ops.wm.usd_export(filepath=path),
+    '.usda': lambda path: bpy.ops.wm.usd_export(filepath=path),
+    '.usdc': lambda path: bpy.ops.wm.usd_export(filepath=path),
+}
 
-# Clear default scene
+# Data that importers create, removed between files in --serve mode; much
+# cheaper than resetting to factory settings for every file
+SCENE_DATA = (
+    'objects', 'meshes', 'curves', 'materials', 'images', 'textures',
+    'armatures', 'actions', 'cameras', 'lights', 'collections',
+)
+
+
+def clear_scene():
+    """Remove everything the previous file brought into the scene"""
+    for name in SCENE_DATA:
+        blocks = getattr(bpy.data, name)
+        for block in list(blocks):
+            blocks.remove(block)
+
+
+def convert(input_file, output_file):
+    """Import input_file into the empty scene and export it to output_file"""
+    # Import based on format
+    ext = os.path.splitext(input_file)[1].lower()
+    importer = IMPORTERS.get(ext)
+    if importer is None:
+        raise RuntimeError(f"Unsupported input format: {ext}")
+    try:
+        importer(input_file)
+        print(f"Imported: {input_file}")
+    except Exception as e:
+        raise RuntimeError(f"Import error: {e}")
+
+    # Export based on requested format, defaulting to STL
+    out_ext = os.path.splitext(output_file)[1].lower()
+    exporter = EXPORTERS.get(out_ext)
+    if exporter is None:
+        output_file = os.path.splitext(output_file)[0] + '.stl'
+        exporter = EXPORTERS['.stl']
+    try:
+        # Select all mesh objects
+        bpy.ops.object.select_all(action='SELECT')
+        exporter(output_file)
+        print(f"Exported: {output_file}")
+    except Exception as e:
+        raise RuntimeError(f"Export error: {e}")
+
+    return output_file
+
+
+# Arguments after "--" belong to this script
+parser = argparse.ArgumentParser(prog='blender_convert')
+parser.add_argument('--serve', action='store_true')
+parser.add_argument('input_file', nargs='?')
+parser.add_argument('output_file', nargs='?')
+parser.add_argument('output_format', nargs='?', default='STL')
+args = parser.parse_args(sys.argv[sys.argv.index("--") + 1:])
+
+# Start from an empty scene; only done once per Blender process
 bpy.ops.wm.read_factory_settings(use_empty=True)
 
-# Get file extension
-ext = os.path.splitext(input_file)[1].lower()
-
-# Import based on format
-try:
-    if ext == '.fbx':
-        bpy.ops.import_scene.fbx(filepath=input_file)
-    elif ext in ['.gltf', '.glb']:
-        bpy.ops.import_scene.gltf(filepath=input_file)
-    elif ext == '.dae':
-        bpy.ops.wm.collada_import(filepath=input_file)
-    elif ext == '.3ds':
-        bpy.ops.import_scene.autodesk_3ds(filepath=input_file)
-    elif ext == '.obj':
-        bpy.ops.wm.obj_import(filepath=input_file)
-    elif ext == '.ply':
-        bpy.ops.wm.ply_import(filepath=input_file)
-    elif ext == '.stl':
-        bpy.ops.wm.stl_import(filepath=input_file)
-    elif ext in ['.usd', '.usda', '.usdc']:
-        bpy.ops.wm.usd_import(filepath=input_file)
-    elif ext == '.abc':
-        bpy.ops.wm.alembic_import(filepath=input_file)
-    elif ext == '.svg':
-        bpy.ops.import_curve.svg(filepath=input_file)
-    elif ext == '.x3d':
-        bpy.ops.import_scene.x3d(filepath=input_file)
-    elif ext == '.wrl':
-        bpy.ops.import_scene.x3d(filepath=input_file)
-    elif ext == '.blend':
-        bpy.ops.wm.open_mainfile(filepath=input_file)
-    elif ext == '.dxf':
-        # DXF import via io_import_dxf addon
+if args.serve:
+    for line in sys.stdin:
+        line = line.rstrip('\\n')
+        if not line:
+            continue
+        input_file, output_file = line.split('\\t')[:2]
         try:
-            bpy.ops.import_scene.dxf(filepath=input_file)
-        except:
-            print(f"DXF import addon not available")
-            sys.exit(1)
-    else:
-        print(f"Unsupported input format: {ext}")
+            result = convert(input_file, output_file)
+            print(f"__DONE__\\t0\\t{result}", flush=True)
+        except Exception as e:
+            print(f"__DONE__\\t1\\t{e}", flush=True)
+        finally:
+            clear_scene()
+else:
+    if not args.output_file:
+        parser.error("input and output files are required")
+    try:
+        convert(args.input_file, args.output_file)
+    except Exception as e:
+        print(e)
         sys.exit(1)
 
-    print(f"Imported: {input_file}")
-
-except Exception as e:
-    print(f"Import error: {e}")
-    sys.exit(1)
-
-# Export based on requested format
-out_ext = os.path.splitext(output_file)[1].lower()
-
-try:
-    # Select all mesh objects
-    bpy.ops.object.select_all(action='SELECT')
-
-    if out_ext == '.stl':
-        bpy.ops.wm.stl_export(filepath=output_file, export_selected_objects=False)
-    elif out_ext == '.obj':
-        bpy.ops.wm.obj_export(filepath=output_file)
-    elif out_ext == '.ply':
-        bpy.ops.wm.ply_export(filepath=output_file)
-    elif out_ext in ['.gltf', '.glb']:
-        bpy.ops.export_scene.gltf(filepath=output_file)
-    elif out_ext == '.fbx':
-        bpy.ops.export_scene.fbx(filepath=output_file)
-    elif out_ext == '.dae':
-        bpy.ops.wm.collada_export(filepath=output_file)
-    elif out_ext in ['.usd', '.usda', '.usdc']:
-        bpy.ops.wm.usd_export(filepath=output_file)
-    else:
-        # Default to STL
-        output_file = output_file.rsplit('.', 1)[0] + '.stl'
-        bpy.ops.wm.stl_export(filepath=output_file)
-
-    print(f"Exported: {output_file}")
-
-except Exception as e:
-    print(f"Export error: {e}")
-    sys.exit(1)
-
-print("Conversion complete!")
+    print("Conversion complete!")
 '''
 
 
+# The script's file name carries a hash of its content, so an existing file
+# can be reused as is and an edited script gets a new file
+# File name of the Blender script; the hash gives a changed script a new
+# file. It is written to the user's FreeCAD data directory: a file in the
+# shared temp directory could be planted there by another user and run
+BLENDER_SCRIPT_NAME = f"blender_convert_{hashlib.sha1(BLENDER_CONVERT_SCRIPT.encode()).hexdigest()[:12]}.py"
+
+
+def get_blender_script():
+    """Get the path of the Blender conversion script, writing it if needed"""
+    script_dir = FreeCAD.getUserAppDataDir()
+    path = os.path.join(script_dir, BLENDER_SCRIPT_NAME)
+    if not os.path.exists(path):
+        # Write under a temporary name and swap it in, so a concurrent
+        # Blender run never sees a half-written script
+        os.makedirs(script_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=script_dir)
+        with os.fdopen(fd, 'w') as f:
+            f.write(BLENDER_CONVERT_SCRIPT)
+        os.replace(temp_path, path)
+    return path
+
+
 class BlenderConverter:
-    """Convert files using Blender as backend"""
+    """
+    Convert files using Blender as backend
+
+    Each conversion normally runs its own Blender process. Used as a context
+    manager (with converter: ...), one Blender process is started on the
+    first conversion and kept running for the rest of the block, so a batch
+    pays Blender's start-up time once instead of once per file. Conversions
+    called from several threads take turns on that process.
+    """
+
+    # Seconds allowed for one file
+    TIMEOUT = 300
+
+    # Lines of Blender output kept for error reports; imports can log
+    # megabytes of warnings, only the end is useful
+    LOG_TAIL_LINES = 200
 
     def __init__(self, blender_path=BLENDER_PATH):
         self.blender_path = blender_path
-        self.script_path = None
-        self._create_script()
+        self.script_path = get_blender_script()
+        self._keep_alive = False
+        self._proc = None
+        self._lines = None
+        self._session_lock = threading.Lock()
+
+    def __enter__(self):
+        self._keep_alive = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._keep_alive = False
+        self.close()
+
+    def _start_session(self):
+        """Start the long-running Blender process if it isn't running"""
+        if self._proc is None:
+            cmd = [
+                self.blender_path,
+                '--background',
+                '--python', self.script_path,
+                '--',
+                '--serve'
+            ]
+            self._proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                bufsize=1
+            )
+            # Read output on a thread so waiting for a result can time out
+            self._lines = queue.Queue()
+            threading.Thread(target=self._read_output, args=(self._proc, self._lines), daemon=True).start()
+        return self._proc
+
+    @staticmethod
+    def _read_output(proc, lines):
+        """Forward Blender's output lines to the queue, then None at exit"""
+        for line in proc.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def close(self):
+        """Stop the long-running Blender process, if any"""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=10)
+        except Exception:
+            proc.kill()
+
+    def _convert_in_session(self, input_file, output_file, quiet=False):
+        """Hand one file to the long-running Blender process"""
+        # The process works through one job at a time, and its replies
+        # must reach the thread that sent the job
+        with self._session_lock:
+            return self._run_session_job(input_file, output_file, quiet)
+
+    def _run_session_job(self, input_file, output_file, quiet=False):
+        """Send one job to the Blender process and wait for its reply"""
+        proc = self._start_session()
+        try:
+            proc.stdin.write(f"{input_file}\t{output_file}\n")
+            proc.stdin.flush()
+        except OSError as e:
+            self.close()
+            FreeCAD.Console.PrintError(f"Blender conversion failed: {e}\n")
+            return None
 
-    def _create_script(self):
-        """Create temporary conversion script"""
-        self.script_path = os.path.join(tempfile.gettempdir(), 'blender_convert.py')
-        with open(self.script_path, 'w') as f:
-            f.write(BLENDER_CONVERT_SCRIPT)
+        log = collections.deque(maxlen=self.LOG_TAIL_LINES)
+        deadline = time.monotonic() + self.TIMEOUT
+        while True:
+            try:
+                line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self.close()
+                FreeCAD.Console.PrintError("Blender conversion timed out\n")
+                return None
+
+            if line is None:
+                self.close()
+                FreeCAD.Console.PrintError(f"Blender error: {''.join(log)}\n")
+                return None
+
+            if line.startswith("__DONE__\t"):
+                _, status, detail = line.rstrip("\n").split("\t", 2)
+                if status == "0" and os.path.exists(detail):
+                    if not quiet:
+                        FreeCAD.Console.PrintMessage(f"Blender conversion successful\n")
+                    return detail
+                FreeCAD.Console.PrintError(f"Blender error: {detail}\n")
+                return None
+
+            log.append(line)
 
     def is_available(self):
         """Check if Blender is available"""
         return os.path.exists(self.blender_path)
 
-    def convert(self, input_file, output_format='stl'):
+    def convert(self, input_file, output_format='stl', quiet=False):
         """
         Convert file using Blender
 
         Args:
             input_file: Path to input file
             output_format: Desired output format (stl, obj, ply, etc.)
+            quiet: Only report errors and warnings
 
         Returns:
             Path to converted file, or None if failed
@@ -209,11 +538,17 @@ class BlenderConverter:
             FreeCAD.Console.PrintError("Blender not found\n")
             return None
 
-        # Determine output path
+        # Determine output path; the tag keeps same-named files from
+        # different folders apart while a batch still has both to insert
         base_name = os.path.splitext(os.path.basename(input_file))[0]
-        output_file = os.path.join(tempfile.gettempdir(), f"{base_name}_converted.{output_format}")
+        tag = hashlib.sha1(os.path.abspath(input_file).encode()).hexdigest()[:8]
+        output_file = os.path.join(tempfile.gettempdir(), f"{base_name}_{tag}_converted.{output_format}")
+
+        say = _no_message if quiet else FreeCAD.Console.PrintMessage
+        say(f"Converting via Blender: {os.path.basename(input_file)}\n")
 
-        FreeCAD.Console.PrintMessage(f"Converting via Blender: {os.path.basename(input_file)}\n")
+        if self._keep_alive:
+            return self._convert_in_session(input_file, output_file, quiet)
 
         # Run Blender in background
         cmd = [
@@ -227,23 +562,43 @@ class BlenderConverter:
         ]
 
         try:
-            result = subprocess.run(
+            # Stream the output, keeping only its tail, instead of
+            # buffering all of it in memory
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=300  # 5 minute timeout
+                encoding='utf-8',
+                errors='replace'
             )
+            timed_out = threading.Event()
 
-            if result.returncode == 0 and os.path.exists(output_file):
-                FreeCAD.Console.PrintMessage(f"Blender conversion successful\n")
+            def kill():
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(self.TIMEOUT, kill)
+            timer.start()
+            tail = collections.deque(maxlen=self.LOG_TAIL_LINES)
+            try:
+                for line in proc.stdout:
+                    tail.append(line)
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+
+            if timed_out.is_set():
+                FreeCAD.Console.PrintError("Blender conversion timed out\n")
+                return None
+
+            if returncode == 0 and os.path.exists(output_file):
+                say(f"Blender conversion successful\n")
                 return output_file
             else:
-                FreeCAD.Console.PrintError(f"Blender error: {result.stderr}\n")
+                FreeCAD.Console.PrintError(f"Blender error: {''.join(tail)}\n")
                 return None
 
-        except subprocess.TimeoutExpired:
-            FreeCAD.Console.PrintError("Blender conversion timed out\n")
-            return None
         except Exception as e:
             FreeCAD.Console.PrintError(f"Blender conversion failed: {e}\n")
             return None
@@ -253,6 +608,44 @@ class BlenderConverter:
 # ODA FILE CONVERTER
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
+def find_oda_converter(preferred_path=ODA_CONVERTER_PATH):
+    """
+    Find the ODA File Converter, or None if it isn't installed
+
+    Checked once per session (see rescan_tools). After the preferred path
+    comes PATH, then one directory listing of each install root, which also
+    finds version-numbered folders like "ODAFileConverter 25.4.0".
+    """
+    if preferred_path and os.path.isfile(preferred_path):
+        return preferred_path
+
+    for name in ODA_EXECUTABLE_NAMES:
+        path = shutil.which(name)
+        if path:
+            return path
+
+    for root in ODA_INSTALL_ROOTS:
+        try:
+            entries = sorted(os.scandir(root), key=lambda entry: entry.name, reverse=True)
+        except OSError:
+            continue
+        # Newest version first, going by the folder name
+        for entry in entries:
+            if entry.is_dir() and entry.name.startswith('ODAFileConverter'):
+                path = os.path.join(entry.path, 'ODAFileConverter.exe')
+                if os.path.isfile(path):
+                    return path
+    return None
+
+
+def rescan_tools():
+    """Forget previously found converter tools so they are searched again"""
+    from ParasolidConverter import find_cad_exchanger
+    find_oda_converter.cache_clear()
+    find_cad_exchanger.cache_clear()
+
+
 class ODAConverter:
     """Convert DWG/DXF files using ODA File Converter"""
 
@@ -261,18 +654,11 @@ class ODAConverter:
 
     def is_available(self):
         """Check if ODA File Converter is available"""
-        if os.path.exists(self.oda_path):
-            return True
-        # Try to find it
-        possible_paths = [
-            r"C:\Program Files\ODA\ODAFileConverter\ODAFileConverter.exe",
-            r"C:\Program Files (x86)\ODA\ODAFileConverter\ODAFileConverter.exe",
-        ]
-        for path in possible_paths:
-            if os.path.exists(path):
-                self.oda_path = path
-                return True
-        return False
+        path = find_oda_converter(self.oda_path)
+        if path is None:
+            return False
+        self.oda_path = path
+        return True
 
     def convert(self, input_file, output_format='dxf'):
         """
@@ -285,57 +671,133 @@ class ODAConverter:
         Returns:
             Path to converted file, or None if failed
         """
+        FreeCAD.Console.PrintMessage(f"Converting via ODA: {os.path.basename(input_file)}\n")
+        return self.convert_batch([input_file], output_format).get(input_file)
+
+    def convert_batch(self, input_files, output_format='dxf'):
+        """
+        Convert several DWG/DXF files with as few ODA runs as possible
+
+        ODA converts whole directories, so the files are linked into a
+        staging directory and converted together in one run instead of
+        starting ODA once per file. Files whose names clash, or that have a
+        different extension, go to another staging directory and run.
+
+        Args:
+            input_files: Paths to DWG or DXF files
+            output_format: 'dxf' or 'dwg'
+
+        Returns:
+            Dict mapping each converted input path to its output path;
+            files that failed are left out
+        """
         if not self.is_available():
             FreeCAD.Console.PrintWarning("ODA File Converter not found\n")
             FreeCAD.Console.PrintMessage("Download free from: https://www.opendesign.com/guestfiles/oda_file_converter\n")
-            return None
-
-        # ODA uses directory-based conversion
-        input_dir = os.path.dirname(input_file)
-        output_dir = tempfile.mkdtemp(prefix='oda_convert_')
+            return {}
 
         # Determine output version
         # Format: ACAD2018, ACAD2013, ACAD2010, ACAD2007, ACAD2004, ACAD2000, ACAD14, ACAD13, ACAD12
         out_version = 'ACAD2018'
         out_type = 'DXF' if output_format.lower() == 'dxf' else 'DWG'
 
-        FreeCAD.Console.PrintMessage(f"Converting via ODA: {os.path.basename(input_file)}\n")
-
-        try:
-            # ODA command line: ODAFileConverter "input_dir" "output_dir" version type recurse audit [filter]
-            cmd = [
-                self.oda_path,
-                input_dir,
-                output_dir,
-                out_version,
-                out_type,
-                '0',  # Don't recurse
-                '1',  # Audit
-                os.path.basename(input_file)  # Filter to specific file
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-
-            # Find output file
-            base_name = os.path.splitext(os.path.basename(input_file))[0]
-            output_file = os.path.join(output_dir, f"{base_name}.{output_format.lower()}")
-
-            if os.path.exists(output_file):
-                FreeCAD.Console.PrintMessage(f"ODA conversion successful\n")
-                return output_file
+        # Group the files into staging directories without name clashes
+        groups = []
+        for input_file in input_files:
+            name = os.path.basename(input_file)
+            ext = get_extension(input_file)
+            for group_ext, members in groups:
+                if group_ext == ext and name.lower() not in members:
+                    break
             else:
-                FreeCAD.Console.PrintError("ODA conversion produced no output\n")
-                return None
-
-        except Exception as e:
-            FreeCAD.Console.PrintError(f"ODA conversion failed: {e}\n")
-            return None
+                members = {}
+                groups.append((ext, members))
+            members[name.lower()] = input_file
+
+        results = {}
+        for ext, members in groups:
+            stage_dir = tempfile.mkdtemp(prefix='oda_input_')
+            output_dir = tempfile.mkdtemp(prefix='oda_convert_')
+            produced = False
+            try:
+                for input_file in members.values():
+                    _stage_file(input_file, os.path.join(stage_dir, os.path.basename(input_file)))
+
+                # ODA command line: ODAFileConverter "input_dir" "output_dir" version type recurse audit [filter]
+                cmd = [
+                    self.oda_path,
+                    stage_dir,
+                    output_dir,
+                    out_version,
+                    out_type,
+                    '0',  # Don't recurse
+                    '1',  # Audit
+                    '*' + ext.upper()  # Everything staged for this run
+                ]
+                # Success is judged by the output files; stderr is kept as
+                # raw bytes and only decoded if something went wrong
+                result = subprocess.run(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=120 * len(members)
+                )
+
+                # Find output files
+                missing = False
+                for input_file in members.values():
+                    base_name = os.path.splitext(os.path.basename(input_file))[0]
+                    output_file = os.path.join(output_dir, f"{base_name}.{output_format.lower()}")
+                    if os.path.exists(output_file):
+                        results[input_file] = output_file
+                        produced = True
+                    else:
+                        missing = True
+                        FreeCAD.Console.PrintError(f"ODA conversion produced no output for {os.path.basename(input_file)}\n")
+                if missing and result.stderr:
+                    FreeCAD.Console.PrintError(f"ODA error: {result.stderr.decode('utf-8', 'replace')}\n")
+            except Exception as e:
+                FreeCAD.Console.PrintError(f"ODA conversion failed: {e}\n")
+            finally:
+                shutil.rmtree(stage_dir, ignore_errors=True)
+                # The output directory goes with the returned files; drop
+                # it here when it has none
+                if not produced:
+                    shutil.rmtree(output_dir, ignore_errors=True)
+
+        if results:
+            FreeCAD.Console.PrintMessage(f"ODA converted {len(results)} of {len(input_files)} file(s)\n")
+        return results
+
+
+def _stage_file(src, dst):
+    """Make src available as dst: a hard link if possible, else a copy"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Different volume, or a filesystem without hard links
+        shutil.copy2(src, dst)
 
 
 # ============================================================================
 # ONLINE CONVERTER (for proprietary formats)
 # ============================================================================
 
+API_KEYS_FILE = os.path.join(os.path.expanduser("~"), ".freecad_converter_keys.json")
+
+
+@functools.lru_cache(maxsize=1)
+def _read_api_keys(mtime_ns):
+    """Parse the API key file; cached until its modification time changes"""
+    if not mtime_ns:
+        return {}
+    try:
+        with open(API_KEYS_FILE, 'rb') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
 class OnlineConverter:
     """Convert proprietary formats using online services"""
 
@@ -344,20 +806,18 @@ class OnlineConverter:
 
     def _load_api_keys(self):
         """Load API keys from config file"""
-        config_file = os.path.join(os.path.expanduser("~"), ".freecad_converter_keys.json")
-        if os.path.exists(config_file):
-            try:
-                with open(config_file) as f:
-                    return json.load(f)
-            except:
-                pass
-        return {}
+        try:
+            mtime_ns = os.stat(API_KEYS_FILE).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        # Copy so changes to this converter's keys don't leak into the cache
+        return dict(_read_api_keys(mtime_ns))
 
     def _save_api_keys(self):
         """Save API keys to config file"""
-        config_file = os.path.join(os.path.expanduser("~"), ".freecad_converter_keys.json")
-        with open(config_file, 'w') as f:
+        with open(API_KEYS_FILE, 'w') as f:
             json.dump(self.api_keys, f)
+        _read_api_keys.cache_clear()
 
     def get_conversion_options(self, input_ext):
         """Get available online conversion options for a format"""
@@ -393,7 +853,7 @@ class OnlineConverter:
 
     def show_manual_instructions(self, input_file):
         """Show instructions for manual online conversion"""
-        ext = os.path.splitext(input_file)[1].lower()
+        ext = get_extension(input_file)
 
         instructions = f"""
 ╔══════════════════════════════════════════════════════════════╗
@@ -430,6 +890,48 @@ class OnlineConverter:
 # UNIVERSAL CONVERTER - MAIN CLASS
 # ============================================================================
 
+def _insert_solid(path, doc_name):
+    """Insert a STEP/IGES/BREP file as solid geometry"""
+    import Part
+    Part.insert(path, doc_name)
+
+
+def _insert_mesh(path, doc_name):
+    """Insert a mesh file"""
+    import Mesh
+    Mesh.insert(path, doc_name)
+
+
+def _insert_dxf(path, doc_name):
+    """Insert a DXF drawing"""
+    import importDXF
+    importDXF.insert(path, doc_name)
+
+
+# Formats made for display (games, rendering, animation). Their meshes are
+# rarely closed, often hundreds of loose shells, so making solids from them
+# just fails object by object; they are imported as meshes only
+VISUALIZATION_FORMATS = frozenset([
+    '.glb', '.gltf', '.fbx', '.3ds', '.dae', '.abc', '.usd', '.usda', '.usdc',
+])
+
+# Extension of a converted file -> (insert function, what it imports as).
+# The modules are imported on first use; after that the import statements
+# are just a sys.modules lookup
+INSERTERS = {
+    '.step': (_insert_solid, 'as solid geometry'),
+    '.stp': (_insert_solid, 'as solid geometry'),
+    '.iges': (_insert_solid, 'as solid geometry'),
+    '.igs': (_insert_solid, 'as solid geometry'),
+    '.brep': (_insert_solid, 'as solid geometry'),
+    '.brp': (_insert_solid, 'as solid geometry'),
+    '.stl': (_insert_mesh, 'as mesh'),
+    '.obj': (_insert_mesh, 'as mesh'),
+    '.ply': (_insert_mesh, 'as mesh'),
+    '.dxf': (_insert_dxf, 'DXF'),
+}
+
+
 class UniversalConverter:
     """
     Universal CAD file converter
@@ -441,11 +943,26 @@ class UniversalConverter:
         self.oda = ODAConverter()
         self.online = OnlineConverter()
 
+        # Input file -> renamed copy made for a sniffed format, until
+        # insert_converted has imported the result
+        self._staged = {}
+
+        self._checked = False
+
         # Check available backends
         self._check_backends()
 
-    def _check_backends(self):
-        """Check which conversion backends are available"""
+    def _check_backends(self, force=False):
+        """
+        Check which conversion backends are available
+
+        Reported once per converter unless force is set, e.g. after the
+        tools have been searched for again.
+        """
+        if self._checked and not force:
+            return
+        self._checked = True
+
         FreeCAD.Console.PrintMessage("\n=== Universal Converter Backends ===\n")
 
         FreeCAD.Console.PrintMessage(f"  FreeCAD: ✓ Always available\n")
@@ -464,54 +981,111 @@ class UniversalConverter:
 
     def get_supported_formats(self):
         """Get list of all supported formats"""
-        formats = {
-            'native': ['.step', '.stp', '.iges', '.igs', '.brep', '.brp', '.stl', '.obj'],
-            'blender': ['.fbx', '.gltf', '.glb', '.dae', '.3ds', '.ply', '.usd', '.abc', '.x3d', '.wrl', '.blend'],
-            'oda': ['.dwg', '.dxf'],
-            'online': ['.x_t', '.x_b', '.catpart', '.catproduct', '.prt', '.sldprt', '.sldasm', '.ipt', '.iam', '.jt', '.sat']
-        }
-        return formats
-
-    def get_handler(self, file_path):
-        """Determine which handler to use for a file"""
-        ext = os.path.splitext(file_path)[1].lower()
-        return FORMAT_HANDLERS.get(ext, 'unknown')
-
-    def convert(self, input_file, target_format='step'):
+        return SUPPORTED_FORMATS
+
+    def prepare_batch(self, input_files):
+        """
+        Convert all DWG/DXF files of a batch in one go
+
+        Starting ODA costs far more than converting a file, so the files
+        are handed to it together. The results belong to the caller: pass
+        them to convert() as prepared, which takes each one out as it is
+        used, and remove_prepared() what is left at the end.
+
+        Returns:
+            Dict of input file -> converted file
+        """
+        oda_files = [f for f in input_files if get_format_handler(f) == 'oda' and os.path.exists(f)]
+        if len(oda_files) > 1 and self.oda.is_available():
+            return self.oda.convert_batch(oda_files, 'dxf')
+        return {}
+
+    @staticmethod
+    def remove_prepared(prepared):
+        """Delete converted files from prepare_batch() that weren't used"""
+        for converted in prepared.values():
+            try:
+                os.remove(converted)
+                # Gone too once the last file of its ODA run is
+                os.rmdir(os.path.dirname(converted))
+            except OSError:
+                pass
+        prepared.clear()
+
+    def convert(self, input_file, target_format='step', quiet=False, prepared=None):
         """
         Convert a file to FreeCAD-compatible format
 
         Args:
             input_file: Path to input file
             target_format: Desired output format (step, stl, obj, etc.)
+            quiet: Only report errors and warnings, e.g. in a batch
+            prepared: Results of prepare_batch(); this file's is used and
+                taken out if there is one
 
         Returns:
-            Path to converted file, or original file if no conversion needed
+            Path to converted file, or original file if no conversion needed.
+            A file recognised by its content may come back as a renamed
+            copy, which insert_converted() removes once it is imported
         """
         if not os.path.exists(input_file):
             FreeCAD.Console.PrintError(f"File not found: {input_file}\n")
             return None
 
-        ext = os.path.splitext(input_file)[1].lower()
-        handler = self.get_handler(input_file)
+        if prepared and input_file in prepared:
+            return prepared.pop(input_file)
+
+        say = _no_message if quiet else FreeCAD.Console.PrintMessage
+
+        ext = get_extension(input_file)
+        if ext in FORMAT_HANDLERS:
+            return self._convert_as(input_file, ext, quiet)
+
+        sniffed = sniff_extension(input_file)
+        if not sniffed:
+            return self._convert_as(input_file, ext, quiet)
 
-        FreeCAD.Console.PrintMessage(f"\n{'='*60}\n")
-        FreeCAD.Console.PrintMessage(f"UNIVERSAL CONVERTER\n")
-        FreeCAD.Console.PrintMessage(f"{'='*60}\n")
-        FreeCAD.Console.PrintMessage(f"Input: {os.path.basename(input_file)}\n")
-        FreeCAD.Console.PrintMessage(f"Format: {ext}\n")
-        FreeCAD.Console.PrintMessage(f"Handler: {handler}\n\n")
+        # The importers go by extension, so give them the file under a name
+        # that matches its content
+        say(f"{os.path.basename(input_file)} looks like a {sniffed} file\n")
+        staged = self._with_extension(input_file, sniffed)
+        converted = None
+        try:
+            converted = self._convert_as(staged, sniffed, quiet)
+        finally:
+            if converted:
+                # insert_converted goes by the format found, and removes the
+                # copy if it is imported as is
+                self._staged[input_file] = staged
+            if converted != staged:
+                shutil.rmtree(os.path.dirname(staged), ignore_errors=True)
+        return converted
+
+    def _convert_as(self, input_file, ext, quiet=False):
+        """Convert input_file, taking it to be an ext file; see convert()"""
+        say = _no_message if quiet else FreeCAD.Console.PrintMessage
+        handler = get_format_handler(input_file, ext)
+
+        if not quiet:
+            FreeCAD.Console.PrintMessage(
+                f"\n{'='*60}\n"
+                f"UNIVERSAL CONVERTER\n"
+                f"{'='*60}\n"
+                f"Input: {os.path.basename(input_file)}\n"
+                f"Format: {ext}\n"
+                f"Handler: {handler}\n\n"
+            )
 
         # Route to appropriate handler
         if handler == 'freecad':
             # No conversion needed, FreeCAD can import directly
-            FreeCAD.Console.PrintMessage("Direct FreeCAD import (no conversion needed)\n")
+            say("Direct FreeCAD import (no conversion needed)\n")
             return input_file
 
         elif handler == 'blender':
             if self.blender.is_available():
                 # Convert via Blender to STL/OBJ, then we can convert to solid if needed
-                converted = self.blender.convert(input_file, 'stl')
+                converted = self.blender.convert(input_file, 'stl', quiet)
                 if converted:
                     return converted
             FreeCAD.Console.PrintWarning("Blender conversion failed or unavailable\n")
@@ -525,11 +1099,16 @@ class UniversalConverter:
                     return converted
             # Fallback to Blender for DXF
             if ext == '.dxf' and self.blender.is_available():
-                return self.blender.convert(input_file, 'stl')
+                return self.blender.convert(input_file, 'stl', quiet)
             FreeCAD.Console.PrintWarning("ODA/Blender conversion failed or unavailable\n")
             return None
 
         elif handler == 'online':
+            if quiet:
+                FreeCAD.Console.PrintWarning(
+                    f"{os.path.basename(input_file)} needs online conversion ({ext})\n"
+                )
+                return None
             # Show online conversion instructions
             instructions = self.online.show_manual_instructions(input_file)
             FreeCAD.Console.PrintMessage(instructions)
@@ -539,91 +1118,265 @@ class UniversalConverter:
             FreeCAD.Console.PrintError(f"Unknown format: {ext}\n")
             return None
 
-    def import_file(self, input_file, convert_to_solid=True):
+    @staticmethod
+    def _with_extension(input_file, ext):
+        """Link or copy input_file into a temp folder, named with ext"""
+        base_name = os.path.basename(input_file)
+        dot = base_name.rfind('.')
+        if dot >= 0:
+            base_name = base_name[:dot]
+        path = os.path.join(tempfile.mkdtemp(prefix='converter_'), base_name + ext)
+        _stage_file(input_file, path)
+        return path
+
+    def import_file(self, input_file, convert_to_solid=True, quiet=False, defer_recompute=False):
         """
         Import a file into FreeCAD, converting if necessary
 
         Args:
             input_file: Path to input file
             convert_to_solid: If True, convert mesh to solid
+            quiet: Only report errors and warnings
+            defer_recompute: Leave recomputing and fitting the view to the
+                caller, e.g. once after a whole batch
 
         Returns:
             FreeCAD document object, or None if failed
         """
         # Convert if needed
-        converted_file = self.convert(input_file)
+        converted_file = self.convert(input_file, quiet=quiet)
 
         if not converted_file:
             return None
 
-        # Get or create document
+        return self.insert_converted(input_file, converted_file, convert_to_solid, quiet, defer_recompute)
+
+    @staticmethod
+    def get_document(input_file):
+        """Get the active document, or create one named after input_file"""
         doc = FreeCAD.ActiveDocument
         if not doc:
             name = os.path.splitext(os.path.basename(input_file))[0]
             name = name.replace('-', '_').replace(' ', '_')
             doc = FreeCAD.newDocument(name)
+        return doc
 
-        ext = os.path.splitext(converted_file)[1].lower()
-
+    @staticmethod
+    def finish_import(doc):
+        """Recompute the document and fit the view to the imported objects"""
+        doc.recompute()
         try:
-            if ext in ['.step', '.stp', '.iges', '.igs', '.brep', '.brp']:
-                # Import as solid
-                Part.insert(converted_file, doc.Name)
-                FreeCAD.Console.PrintMessage(f"Imported as solid geometry\n")
-
-            elif ext in ['.stl', '.obj', '.ply']:
-                # Import as mesh
-                Mesh.insert(converted_file, doc.Name)
-                FreeCAD.Console.PrintMessage(f"Imported as mesh\n")
-
-                # Optionally convert to solid
-                if convert_to_solid:
-                    FreeCAD.Console.PrintMessage("Converting mesh to solid...\n")
-                    self._convert_mesh_to_solid(doc)
-
-            elif ext == '.dxf':
-                # Import DXF
-                import importDXF
-                importDXF.insert(converted_file, doc.Name)
-                FreeCAD.Console.PrintMessage(f"Imported DXF\n")
+            import FreeCADGui
+            FreeCADGui.ActiveDocument.ActiveView.fitAll()
+        except Exception:
+            pass  # Running in console mode
 
-            else:
+    def insert_converted(self, input_file, converted_file, convert_to_solid=True, quiet=False,
+                         defer_recompute=False):
+        """
+        Insert a file returned by convert() into the active document
+
+        Changes the document, so only call this from the main thread.
+
+        Args:
+            input_file: Path of the original file, used to name a new document
+            converted_file: Path returned by convert()
+            convert_to_solid: If True, convert mesh to solid; ignored for
+                files that came from VISUALIZATION_FORMATS
+            quiet: Only report errors and warnings
+            defer_recompute: Leave finish_import() to the caller
+
+        Returns:
+            FreeCAD document object, or None if failed
+        """
+        # Get or create document
+        doc = self.get_document(input_file)
+
+        # A file convert() recognised by its content comes back as a renamed
+        # copy; that name has the extension that counts
+        staged = self._staged.pop(input_file, None)
+        original = staged or input_file
+
+        # Direct imports come back as the input file itself, so its
+        # extension is only worked out once
+        input_ext = get_extension(original)
+        ext = input_ext if converted_file == original else get_extension(converted_file)
+
+        try:
+            inserter = INSERTERS.get(ext)
+            if inserter is None:
                 FreeCAD.Console.PrintWarning(f"Direct import not implemented for {ext}\n")
                 return None
 
-            doc.recompute()
-            FreeCADGui.ActiveDocument.ActiveView.fitAll()
+            say = _no_message if quiet else FreeCAD.Console.PrintMessage
+            insert, description = inserter
+            to_solid = (insert is _insert_mesh and convert_to_solid
+                        and input_ext not in VISUALIZATION_FORMATS)
+            existing = {obj.Name for obj in doc.Objects} if to_solid else None
+            insert(converted_file, doc.Name)
+            say(f"Imported {description}\n")
+
+            # Optionally convert to solid, only the meshes this file added
+            if to_solid:
+                say("Converting mesh to solid...\n")
+                added = [obj for obj in doc.Objects if obj.Name not in existing]
+                self._convert_mesh_to_solid(doc, quiet, added)
+
+            if not defer_recompute:
+                self.finish_import(doc)
 
             return doc
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Import failed: {e}\n")
             return None
+        finally:
+            if staged:
+                shutil.rmtree(os.path.dirname(staged), ignore_errors=True)
 
-    def _convert_mesh_to_solid(self, doc):
-        """Convert mesh objects in document to solids"""
-        for obj in doc.Objects:
-            if obj.isDerivedFrom("Mesh::Feature"):
-                try:
-                    # Convert mesh to shape
-                    shape = Part.Shape()
-                    shape.makeShapeFromMesh(obj.Mesh.Topology, 0.1)
-                    shape = shape.copy()
-                    shape.sewShape()
+    def _convert_mesh_to_solid(self, doc, quiet=False, objects=None):
+        """
+        Convert mesh objects in document to solids, or only those among
+        objects if given
+
+        With several meshes the solids are built side by side in FreeCADCmd
+        processes (see ConverterCommands.build_solids_in_parallel), since
+        the OCCT calls hold the GIL; only adding them to the document
+        happens here. Meshes that couldn't be done that way are converted
+        in this process.
+        """
+        import Part
+
+        if objects is None:
+            objects = doc.Objects
+        meshes = [obj for obj in objects if obj.isDerivedFrom("Mesh::Feature")]
+        if not meshes:
+            return
 
-                    try:
-                        solid = Part.makeSolid(shape)
-                    except:
-                        solid = shape
+        work_dir = tempfile.mkdtemp(prefix='mesh_to_solid_')
+        try:
+            breps = {}
+            if len(meshes) > 1:
+                breps = self._build_solids_in_parallel(meshes, work_dir)
+
+            for obj in meshes:
+                try:
+                    brep = breps.get(obj.Name)
+                    if brep:
+                        solid = Part.read(brep)
+                    else:
+                        solid = self._mesh_to_solid(obj.Mesh)
 
                     # Create solid object
                     solid_obj = doc.addObject("Part::Feature", obj.Name + "_Solid")
                     solid_obj.Shape = solid
 
-                    FreeCAD.Console.PrintMessage(f"Converted {obj.Name} to solid\n")
+                    if not quiet:
+                        FreeCAD.Console.PrintMessage(f"Converted {obj.Name} to solid\n")
 
                 except Exception as e:
                     FreeCAD.Console.PrintWarning(f"Could not convert {obj.Name}: {e}\n")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    @staticmethod
+    def _build_solids_in_parallel(meshes, work_dir):
+        """Build solids for mesh objects in FreeCADCmd; object name -> BREP path"""
+        from ConverterCommands import build_solids_in_parallel
+
+        mesh_files = {}
+        for i, obj in enumerate(meshes):
+            # FreeCAD's own binary mesh format: quick to write and read back
+            path = os.path.join(work_dir, f"mesh_{i}.bms")
+            try:
+                obj.Mesh.write(path)
+            except Exception:
+                continue
+            mesh_files[path] = obj.Name
+
+        FreeCAD.Console.PrintMessage(f"Building {len(mesh_files)} solids in parallel...\n")
+        results = build_solids_in_parallel(list(mesh_files), work_dir, tolerance=0.1, sewing=True)
+        return {mesh_files[path]: brep for path, brep in results.items() if brep}
+
+    @staticmethod
+    def _mesh_to_solid(mesh):
+        """Convert a mesh to a solid in this process, or a shell if it isn't closed"""
+        import Part
+
+        # Convert mesh to shape. The shape is local, so it is sewn in place
+        # rather than sewing a copy of it
+        shape = Part.Shape()
+        try:
+            # FreeCAD 0.20+ can sew while building the faces
+            shape.makeShapeFromMesh(mesh.Topology, 0.1, True)
+        except TypeError:
+            shape.makeShapeFromMesh(mesh.Topology, 0.1)
+            shape.sewShape()
+
+        try:
+            return Part.makeSolid(shape)
+        except:
+            return shape
+
+
+# Shared converter used by the commands, so backend detection runs once
+_universal_converter = None
+
+
+def get_universal_converter():
+    """Get the shared UniversalConverter used by the import commands"""
+    global _universal_converter
+    if _universal_converter is None:
+        _universal_converter = UniversalConverter()
+    return _universal_converter
+
+
+# The background import started by a command (see ImportWorker); kept so it
+# isn't garbage collected while running. The shared converter's Blender
+# session serves one import at a time
+_import_job = None
+
+
+def start_import(job):
+    """Start an ImportWorker.ImportJob as the current import"""
+    global _import_job
+    _import_job = job
+    job.start()
+
+
+def import_running():
+    """Whether a background import is still in progress"""
+    return _import_job is not None and _import_job.running
+
+
+# File dialogs of the import commands by title, created on first use and
+# kept, so Qt parses their filters once and each reopens in the folder it
+# was last used in
+_file_dialogs = {}
+
+
+def _choose_files(title, name_filters, multiple=False):
+    """
+    Ask for files to import with the kept dialog for title
+
+    Returns:
+        List of selected paths, empty if the dialog was cancelled
+    """
+    from PySide2 import QtWidgets
+
+    dialog = _file_dialogs.get(title)
+    if dialog is None:
+        import FreeCADGui
+        dialog = QtWidgets.QFileDialog(FreeCADGui.getMainWindow(), title)
+        dialog.setNameFilters(list(name_filters))
+        dialog.setFileMode(
+            QtWidgets.QFileDialog.ExistingFiles if multiple else QtWidgets.QFileDialog.ExistingFile
+        )
+        _file_dialogs[title] = dialog
+
+    if not dialog.exec_():
+        return []
+    return dialog.selectedFiles()
 
 
 # ============================================================================
@@ -633,118 +1386,78 @@ class UniversalConverter:
 class UniversalImportCommand:
     """FreeCAD command for universal file import"""
 
-    def GetResources(self):
-        return {
-            'MenuText': 'Universal Import...',
-            'ToolTip': 'Import any CAD file format (auto-converts as needed)'
-        }
-
     def Activated(self):
-        # Build file filter from supported formats
-        converter = UniversalConverter()
-        formats = converter.get_supported_formats()
-
-        all_formats = []
-        for fmt_list in formats.values():
-            all_formats.extend(fmt_list)
-
-        filter_str = "All CAD Files ({});;".format(' '.join(['*' + f for f in all_formats]))
-        filter_str += "STEP Files (*.step *.stp);;"
-        filter_str += "IGES Files (*.iges *.igs);;"
-        filter_str += "Mesh Files (*.stl *.obj *.ply);;"
-        filter_str += "Blender/Game (*.fbx *.gltf *.glb *.dae *.3ds);;"
-        filter_str += "DWG/DXF (*.dwg *.dxf);;"
-        filter_str += "Proprietary CAD (*.x_t *.sldprt *.catpart *.prt *.ipt);;"
-        filter_str += "All Files (*.*)"
-
-        filename, _ = QtWidgets.QFileDialog.getOpenFileName(
-            None,
-            "Universal CAD Import",
-            "",
-            filter_str
-        )
+        from ImportWorker import ImportJob
+
+        filenames = _choose_files("Universal CAD Import", IMPORT_NAME_FILTERS)
 
-        if filename:
-            converter.import_file(filename, convert_to_solid=True)
+        if filenames:
+            # Convert in the background so FreeCAD keeps repainting
+            start_import(ImportJob(get_universal_converter(), filenames[:1]))
 
     def IsActive(self):
-        return True
+        return not import_running()
 
 
 class BatchUniversalImportCommand:
     """Batch import multiple files"""
 
-    def GetResources(self):
-        return {
-            'MenuText': 'Batch Universal Import...',
-            'ToolTip': 'Import multiple CAD files at once'
-        }
+    @staticmethod
+    def _disk_order(filenames):
+        """
+        Sort files by inode number, roughly their order on disk
+
+        Reading a cold batch in that order needs fewer seeks than the
+        dialog's alphabetical order. Only done on POSIX; Windows st_ino
+        values say nothing about placement.
+        """
+        if os.name != 'posix':
+            return list(filenames)
+
+        def inode(path):
+            try:
+                return os.stat(path).st_ino
+            except OSError:
+                return 0
+
+        return sorted(filenames, key=inode)
 
     def Activated(self):
-        filenames, _ = QtWidgets.QFileDialog.getOpenFileNames(
-            None,
-            "Select Files to Import",
-            "",
-            "All CAD Files (*.step *.stp *.iges *.igs *.stl *.obj *.fbx *.gltf *.dae *.3ds *.dwg *.dxf);;All Files (*.*)"
-        )
+        from ImportWorker import ImportJob
 
-        if filenames:
-            converter = UniversalConverter()
-            success = 0
-            failed = 0
+        filenames = _choose_files("Select Files to Import", BATCH_NAME_FILTERS, multiple=True)
 
-            for filename in filenames:
-                FreeCAD.Console.PrintMessage(f"\n--- Importing: {os.path.basename(filename)} ---\n")
-                result = converter.import_file(filename)
-                if result:
-                    success += 1
-                else:
-                    failed += 1
+        if filenames:
+            filenames = self._disk_order(filenames)
 
-            FreeCAD.Console.PrintMessage(f"\n=== Batch Import Complete: {success} success, {failed} failed ===\n")
+            # The files are converted in the background; the job inserts
+            # each result into the document on the GUI thread, in the same
+            # order, and recomputes once at the end
+            start_import(ImportJob(get_universal_converter(), filenames, batch=True))
 
     def IsActive(self):
-        return True
+        return not import_running()
 
 
 class ShowSupportedFormatsCommand:
     """Show all supported formats"""
 
-    def GetResources(self):
-        return {
-            'MenuText': 'Supported Formats...',
-            'ToolTip': 'Show all supported CAD file formats'
-        }
-
     def Activated(self):
-        converter = UniversalConverter()
-        formats = converter.get_supported_formats()
-
-        msg = "═══════════════════════════════════════════\n"
-        msg += "      SUPPORTED CAD FORMATS\n"
-        msg += "═══════════════════════════════════════════\n\n"
+        from PySide2 import QtWidgets
 
-        msg += "NATIVE (FreeCAD):\n"
-        msg += "  " + ", ".join(formats['native']) + "\n\n"
+        QtWidgets.QMessageBox.information(None, "Supported Formats", SUPPORTED_FORMATS_TEXT)
 
-        msg += "VIA BLENDER:\n"
-        msg += "  " + ", ".join(formats['blender']) + "\n\n"
-
-        msg += "VIA ODA CONVERTER:\n"
-        msg += "  " + ", ".join(formats['oda']) + "\n\n"
+    def IsActive(self):
+        return True
 
-        msg += "ONLINE CONVERSION:\n"
-        msg += "  " + ", ".join(formats['online']) + "\n\n"
 
-        msg += "═══════════════════════════════════════════\n"
+class RescanToolsCommand:
+    """Search again for external converter tools"""
 
-        QtWidgets.QMessageBox.information(None, "Supported Formats", msg)
+    def Activated(self):
+        rescan_tools()
+        # Report which backends are found now
+        get_universal_converter()._check_backends(force=True)
 
     def IsActive(self):
         return True
-
-
-# Register commands
-FreeCADGui.addCommand('Converter_UniversalImport', UniversalImportCommand())
-FreeCADGui.addCommand('Converter_BatchUniversalImport', BatchUniversalImportCommand())
-FreeCADGui.addCommand('Converter_ShowFormats', ShowSupportedFormatsCommand())
@@ -5,13 +5,52 @@ Import/export PCB designs between FreeCAD and EasyEDA
 
 import os
 import json
+import collections
 import FreeCAD
 import FreeCADGui
-from PySide2 import QtWidgets
 
 # EasyEDA exports JSON format which we can parse
 
 
+def load_easyeda_data(f):
+    """
+    Load EasyEDA JSON from a binary file object
+
+    Board exports can be tens of MB, nearly all of it the 'shape' list.
+    With the optional 'ijson' package (pip install ijson) that list is
+    returned as an iterator that parses one shape at a time while it is
+    consumed, so f must stay open until processing is done. Without ijson,
+    or for other layouts, the whole document is loaded with json.
+
+    Args:
+        f: File opened in binary mode
+
+    Returns:
+        The document dict (or whatever the JSON holds)
+    """
+    try:
+        import ijson
+    except ImportError:
+        return json.load(f)
+
+    # Find the format from the top-level keys; this only tokenises up to
+    # the first key that decides it, building no values
+    data = None
+    for prefix, event, value in ijson.parse(f):
+        if prefix == '' and event == 'map_key' and value in ('head', 'spiData'):
+            if value == 'head':
+                data = {'head': None}
+            break
+        if prefix == '' and event in ('start_array', 'end_map'):
+            break
+
+    f.seek(0)
+    if data is None:
+        return json.load(f)
+    data['shape'] = ijson.items(f, 'shape.item')
+    return data
+
+
 class EasyEDAImportCommand:
     """Import EasyEDA project JSON file"""
 
@@ -22,6 +61,8 @@ class EasyEDAImportCommand:
         }
 
     def Activated(self):
+        from PySide2 import QtWidgets
+
         # Open file dialog
         filename, _ = QtWidgets.QFileDialog.getOpenFileName(
             None,
@@ -34,10 +75,10 @@ class EasyEDAImportCommand:
             return
 
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            self.process_easyeda_data(data, filename)
+            # Processed inside the with block: the shapes may be streamed
+            with open(filename, 'rb') as f:
+                data = load_easyeda_data(f)
+                self.process_easyeda_data(data, filename)
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Error importing EasyEDA file: {e}\n")
@@ -69,17 +110,18 @@ class EasyEDAImportCommand:
 
     def process_standard_format(self, data, group, doc):
         """Process standard EasyEDA JSON export"""
-        # Extract board outline
-        if 'shape' in data:
-            for shape in data.get('shape', []):
-                if isinstance(shape, str) and shape.startswith('TRACK'):
-                    # Parse track data
-                    pass
+        # Shape strings are "TAG~field~field~..."; only the tag is split
+        # off, the fields aren't used yet
+        counts = collections.Counter(
+            shape.partition('~')[0] for shape in data.get('shape', []) if isinstance(shape, str)
+        )
 
         # Create placeholder info object
         info = doc.addObject("App::FeaturePython", "PCB_Info")
         info.addProperty("App::PropertyString", "Source", "EasyEDA", "Source file")
         info.Source = "EasyEDA"
+        info.addProperty("App::PropertyString", "Shapes", "EasyEDA", "Shape count by type")
+        info.Shapes = ", ".join(f"{tag}: {count}" for tag, count in counts.most_common())
         group.addObject(info)
 
     def process_project_format(self, data, group, doc):
@@ -110,12 +152,14 @@ class EasyEDAExport3DCommand:
         }
 
     def Activated(self):
+        from PySide2 import QtWidgets
+
         selection = FreeCADGui.Selection.getSelection()
         if not selection:
             FreeCAD.Console.PrintWarning("No objects selected for export\n")
             return
 
-        filename, _ = QtWidgets.QFileDialog.getSaveFileName(
+        filename, selected_filter = QtWidgets.QFileDialog.getSaveFileName(
             None,
             "Export 3D Model",
             "",
@@ -125,16 +169,22 @@ class EasyEDAExport3DCommand:
         if not filename:
             return
 
+        # The exporters go by the extension, so add the chosen type's one
+        # if the name doesn't have it
+        if not filename.lower().endswith(('.step', '.stp', '.wrl')):
+            filename += '.wrl' if selected_filter.startswith('WRL') else '.step'
+
         try:
             import Part
-            shapes = []
-            for obj in selection:
-                if hasattr(obj, 'Shape'):
-                    shapes.append(obj.Shape)
-
-            if shapes:
-                compound = Part.makeCompound(shapes)
-                compound.exportStep(filename)
+            objects = [obj for obj in selection if hasattr(obj, 'Shape')]
+
+            if objects:
+                # Export the objects directly in one pass; no intermediate
+                # compound copy of every shape
+                if filename.lower().endswith('.wrl'):
+                    FreeCADGui.export(objects, filename)
+                else:
+                    Part.export(objects, filename)
                 FreeCAD.Console.PrintMessage(f"Exported to {filename}\n")
             else:
                 FreeCAD.Console.PrintWarning("No valid shapes to export\n")
@@ -4,6 +4,7 @@ Provides FreeCAD commands for FEMM integration
 """
 
 import os
+import functools
 import subprocess
 import FreeCAD
 import FreeCADGui
@@ -11,17 +12,26 @@ import FreeCADGui
 # Path to FEMM installation (default Windows location)
 FEMM_PATH = r"C:\femm42\bin\femm.exe"
 
+# Where FEMM is looked for when no path is set
+FEMM_SEARCH_PATHS = [
+    r"C:\femm42\bin\femm.exe",
+    r"C:\Program Files\femm42\bin\femm.exe",
+    r"C:\Program Files (x86)\femm42\bin\femm.exe",
+]
 
+FEMM_PARAMS = "User parameter:BaseApp/Preferences/Mod/FEMMBridge"
+
+
+@functools.lru_cache(maxsize=1)
 def find_femm():
-    """Locate FEMM installation"""
-    possible_paths = [
-        r"C:\femm42\bin\femm.exe",
-        r"C:\Program Files\femm42\bin\femm.exe",
-        r"C:\Program Files (x86)\femm42\bin\femm.exe",
-    ]
-
-    for path in possible_paths:
-        if os.path.exists(path):
+    """
+    Locate FEMM installation
+
+    Searched once per session; get_femm_path() searches again if the
+    file found has gone, and set_femm_path() clears the cached result.
+    """
+    for path in FEMM_SEARCH_PATHS:
+        if os.path.isfile(path):
             return path
 
     return None
@@ -29,15 +39,19 @@ def find_femm():
 
 def get_femm_path():
     """Get FEMM executable path from settings or auto-detect"""
-    # Try to get from FreeCAD parameters
-    params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/FEMMBridge")
+    # The setting is read every time, as the user may change it, and
+    # checked on disk in case FEMM was removed
+    params = FreeCAD.ParamGet(FEMM_PARAMS)
     path = params.GetString("FEMMPath", "")
 
-    if path and os.path.exists(path):
+    if path and os.path.isfile(path):
         return path
 
     # Auto-detect
     detected = find_femm()
+    if detected and not os.path.isfile(detected):
+        find_femm.cache_clear()
+        detected = find_femm()
     if detected:
         params.SetString("FEMMPath", detected)
         return detected
@@ -45,6 +59,12 @@ def get_femm_path():
     return None
 
 
+def set_femm_path(path):
+    """Store the FEMM executable path in the settings"""
+    FreeCAD.ParamGet(FEMM_PARAMS).SetString("FEMMPath", path)
+    find_femm.cache_clear()
+
+
 class FEMMNewMagneticCommand:
     """Create a new magnetic analysis"""
 
@@ -179,13 +199,26 @@ class FEMMSettingsCommand:
         }
 
     def Activated(self):
-        # TODO: Create settings dialog
+        from PySide2 import QtWidgets
+
         femm_path = get_femm_path()
         if femm_path:
             FreeCAD.Console.PrintMessage(f"FEMM path: {femm_path}\n")
         else:
             FreeCAD.Console.PrintWarning("FEMM not configured\n")
 
+        # Let the user pick the FEMM executable
+        filename, _ = QtWidgets.QFileDialog.getOpenFileName(
+            None,
+            "Select FEMM Executable",
+            os.path.dirname(femm_path) if femm_path else "",
+            "FEMM (femm.exe);;Executables (*.exe);;All Files (*.*)"
+        )
+
+        if filename:
+            set_femm_path(filename)
+            FreeCAD.Console.PrintMessage(f"FEMM path set to: {filename}\n")
+
     def IsActive(self):
         return True
 